@@ -203,6 +203,12 @@ Configuration Fields:
 - supported_nested_fields: Nested paths like "from/emailAddress/address" (filter mode)
 - array_fields: Fields that are arrays and use /any() or /all() operators (filter mode)
 - array_element_paths: Paths within array elements for filtering (filter mode)
+- max_connections: Maximum concurrent Graph API connections (default: 1000)
+- max_keepalive_connections: Idle connections kept open for reuse (default: 100)
+  (both are read from the top level of the configuration, as all tables share
+  one Graph client)
+- concurrency: Maximum mailboxes enumerated concurrently (default: 16)
+- use_batch: Fetch the first page of all mailboxes through $batch (default: True)
 
 Search Keywords (when use_search=True):
 - from: Sender email address
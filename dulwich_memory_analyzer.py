@@ -27,6 +27,9 @@ from dataclasses import dataclass, asdict
 import time
 import re
 import fnmatch
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urlunparse
 
 # Dulwich imports
@@ -57,6 +60,11 @@ except ImportError:
     print("⚠️  Tree-sitter not available - limited analysis capabilities")
     TREE_SITTER_AVAILABLE = False
 
+# Files are parsed ahead of the analysis in worker threads; tree-sitter
+# releases the GIL while parsing. At most PARSE_AHEAD parsed trees wait.
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+PARSE_AHEAD = 2 * PARSE_WORKERS
+
 
 @dataclass
 class VirtualFile:
@@ -142,6 +150,9 @@ class InMemoryAnalyzer:
         self.functions: Dict[str, FunctionInfo] = {}
         self.classes: Dict[str, ClassInfo] = {}
 
+        # search_combined results by (pattern, search_type), reset on analysis
+        self._search_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+
         # Initialize tree-sitter if available
         if TREE_SITTER_AVAILABLE:
             try:
@@ -387,21 +398,21 @@ class InMemoryAnalyzer:
 
     def _analyze_python_files(self):
         """Analyze Python files using tree-sitter"""
+        self._search_cache.clear()
         if not self.parser:
             return
 
         total_files = len(self.virtual_files)
         analyzed_count = 0
 
-        for file_path, virtual_file in self.virtual_files.items():
+        for file_path, content, parsed in self._parse_ahead(self.virtual_files.items()):
             try:
                 analyzed_count += 1
                 self._progress_update(
                     f"Analyzing file {analyzed_count}/{total_files}: {file_path}"
                 )
 
-                content = virtual_file.content
-                tree = self.parser.parse(content)
+                tree = parsed.result()
                 root_node = tree.root_node
 
                 # Analyze functions
@@ -413,6 +424,31 @@ class InMemoryAnalyzer:
             except Exception as e:
                 self._log(f"⚠️  Error analyzing {file_path}: {e}")
 
+    def _parse_ahead(self, files):
+        """Yield (file_path, content, future tree) in order, parsing ahead
+
+        Each worker thread gets its own parser, as parsers are not shared
+        between threads.
+        """
+        local = threading.local()
+
+        def parse(content: bytes):
+            parser = getattr(local, "parser", None)
+            if parser is None:
+                parser = local.parser = Parser()
+                parser.language = self.language
+            return parser.parse(content)
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+            for file_path, virtual_file in files:
+                content = virtual_file.content
+                pending.append((file_path, content, executor.submit(parse, content)))
+                if len(pending) > PARSE_AHEAD:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+
     def _analyze_functions_in_file(
         self, root_node, source_bytes: bytes, file_path: str
     ):
@@ -576,6 +612,10 @@ class InMemoryAnalyzer:
         self, pattern: str, search_type: str = "both"
     ) -> List[Dict[str, Any]]:
         """Search functions and/or classes matching pattern"""
+        cache_key = (pattern, search_type)
+        if cache_key in self._search_cache:
+            return list(self._search_cache[cache_key])
+
         try:
             regex = re.compile(pattern, re.IGNORECASE)
         except re.error as e:
@@ -588,21 +628,7 @@ class InMemoryAnalyzer:
         if search_type in ["both", "functions"]:
             for func_name, func_info in self.functions.items():
                 if regex.search(func_info.name) or regex.search(func_name):
-                    highlighted_name = regex.sub(lambda m: f"[{m.group()}]", func_name)
-                    matches.append(
-                        {
-                            "type": "function",
-                            "name": func_name,
-                            "highlighted_name": highlighted_name,
-                            "file": func_info.file_path,
-                            "line_start": func_info.line_start,
-                            "line_end": func_info.line_end,
-                            "is_method": func_info.is_method,
-                            "class_name": func_info.class_name,
-                            "is_async": func_info.is_async,
-                            "signature": func_info.signature,
-                        }
-                    )
+                    matches.append(self._function_match(func_name, func_info, regex))
 
         # Search classes
         if search_type in ["both", "classes"]:
@@ -622,7 +648,79 @@ class InMemoryAnalyzer:
                         }
                     )
 
-        return matches
+        self._search_cache[cache_key] = matches
+        return list(matches)
+
+    def search_functions_multi(
+        self, patterns: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search functions for several patterns in one pass
+
+        Returns the search_combined(pattern, "functions") results for each
+        pattern. One alternation of all patterns skips the functions that
+        match none of them, so only the hits are checked per pattern.
+        """
+        results = {}
+        regexes = {}
+        for pattern in patterns:
+            cache_key = (pattern, "functions")
+            if cache_key in self._search_cache:
+                results[pattern] = list(self._search_cache[cache_key])
+                continue
+            try:
+                regexes[pattern] = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                self._log(f"❌ Invalid regex pattern '{pattern}': {e}")
+                results[pattern] = []
+
+        if not regexes:
+            return results
+
+        combined = None
+        # Joining patterns renumbers their groups, which breaks backreferences
+        # such as (a)\1, so patterns with groups are checked one by one
+        if not any(regex.groups for regex in regexes.values()):
+            try:
+                combined = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern in regexes), re.IGNORECASE
+                )
+            except re.error:
+                combined = None
+
+        matches = {pattern: [] for pattern in regexes}
+        for func_name, func_info in self.functions.items():
+            if combined and not (
+                combined.search(func_info.name) or combined.search(func_name)
+            ):
+                continue
+            for pattern, regex in regexes.items():
+                if regex.search(func_info.name) or regex.search(func_name):
+                    matches[pattern].append(
+                        self._function_match(func_name, func_info, regex)
+                    )
+
+        for pattern, pattern_matches in matches.items():
+            self._search_cache[(pattern, "functions")] = pattern_matches
+            results[pattern] = list(pattern_matches)
+
+        return {pattern: results[pattern] for pattern in patterns}
+
+    def _function_match(
+        self, func_name: str, func_info: FunctionInfo, regex: re.Pattern
+    ) -> Dict[str, Any]:
+        """Build the search result for a matching function"""
+        return {
+            "type": "function",
+            "name": func_name,
+            "highlighted_name": regex.sub(lambda m: f"[{m.group()}]", func_name),
+            "file": func_info.file_path,
+            "line_start": func_info.line_start,
+            "line_end": func_info.line_end,
+            "is_method": func_info.is_method,
+            "class_name": func_info.class_name,
+            "is_async": func_info.is_async,
+            "signature": func_info.signature,
+        }
 
     def preview_method(self, identifier: str) -> None:
         """Preview method/function content"""
@@ -1185,10 +1185,14 @@ async def main():
         enable_notifications=not args.interactive,  # Disable notifications for interactive mode
     )
 
-    if args.interactive:
-        await assistant.run_interactive_mode()
-    else:
-        await assistant.run_single_mode()
+    try:
+        if args.interactive:
+            await assistant.run_interactive_mode()
+        else:
+            await assistant.run_single_mode()
+    finally:
+        # Close the notification clients while their event loop is running
+        await assistant.notification_manager.aclose()
 
 
 if __name__ == "__main__":
@@ -479,10 +479,14 @@ async def main():
         enable_notifications=not args.interactive,  # Disable notifications for interactive mode
     )
 
-    if args.interactive:
-        await assistant.run_interactive_with_notifications()
-    else:
-        await assistant.run_single_mode_with_notifications()
+    try:
+        if args.interactive:
+            await assistant.run_interactive_with_notifications()
+        else:
+            await assistant.run_single_mode_with_notifications()
+    finally:
+        # Close the notification clients while their event loop is running
+        await assistant.notification_manager.aclose()
 
 
 if __name__ == "__main__":
@@ -6,20 +6,94 @@ with thread support for progress updates.
 """
 
 import asyncio
+import copy
+import functools
 import json
 import logging
 import os
+import re
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union
+from dataclasses import dataclass
 import httpx
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; the config loader re-reads the environment itself
+SLACK_ENV_CONFIGURED = bool(
+    os.getenv("SLACK_BOT_TOKEN") or os.getenv("SLACK_WEBHOOK_URL")
+)
+
+# **bold** -> *bold*, tolerating single asterisks and newlines inside the span
+_MARKDOWN_BOLD_RE = re.compile(r"\*\*([^*]+(?:\*(?!\*)[^*]*)*)\*\*", re.DOTALL)
+
+# Every markdown construct rewritten for Slack, matched in a single sweep
+_MARKDOWN_TOKEN_RE = re.compile(
+    r"(?P<code>```\w*\n(?P<code_body>.*?)\n```)"
+    r"|^#{1,3} (?P<header>[^\n]+)$"
+    r"|^(?:-|(?P<indent>[ \t]*)•)[ \t]+(?P<bullet>[^\n]+)$"
+    r"|(?P<bold>\*\*(?P<bold_text>[^*]+(?:\*(?!\*)[^*]*)*)\*\*)",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def _convert_bold_to_slack(text: str) -> str:
+    """Convert **bold** spans to Slack's *bold*."""
+    return _MARKDOWN_BOLD_RE.sub(r"*\1*", text)
+
+
+def _markdown_token_to_slack(match: "re.Match[str]") -> str:
+    """Rewrite a single markdown token matched by _MARKDOWN_TOKEN_RE."""
+    kind = match.lastgroup
+    if kind == "code":
+        # Drop the language hint; the block body is left untouched
+        return f"```\n{match.group('code_body')}\n```"
+    if kind == "header":
+        return f"*{_convert_bold_to_slack(match.group('header'))}*"
+    if kind == "bullet":
+        indent = match.group("indent") or ""
+        return f"{indent}• {_convert_bold_to_slack(match.group('bullet'))}"
+    return f"*{match.group('bold_text')}*"
+
+
+@functools.lru_cache(maxsize=128)
+def _repo_name(path: str) -> str:
+    """Return the display name of a repository path."""
+    return os.path.basename(path.rstrip("/"))
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as 'YYYY-MM-DD HH:MM:SS UTC' (no strftime)."""
+    now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+    return now.isoformat(sep=" ") + " UTC"
+
+
+def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a Slack payload to JSON bytes once, ready to post as content."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
 
-@dataclass
+
+@dataclass(slots=True, kw_only=True)
 class NotificationMessage:
     """Represents a notification message with metadata."""
 
@@ -32,10 +106,10 @@ class NotificationMessage:
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+            self.timestamp = datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class AnalysisSummary:
     """Summary of analysis to be performed."""
 
@@ -104,6 +178,10 @@ class NotificationProvider(ABC):
         )
         return await self.send_progress_update(message)
 
+    async def aclose(self):
+        """Release any resources held by the provider."""
+        pass
+
 
 class SlackNotificationProvider(NotificationProvider):
     """Slack notification provider using Web API for proper threading."""
@@ -115,8 +193,18 @@ class SlackNotificationProvider(NotificationProvider):
         self.channel = config.get("channel", "#general")
         self.username = config.get("username", "Logan Analyzer")
         self.thread_ts = None  # For threading messages
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self.use_web_api = bool(self.bot_token)  # Use Web API if bot token available
 
+        # Resolve the transport once so the send path does not re-check it
+        if self.use_web_api:
+            self._post = self._post_web_api
+            self._decorate_payload = self._decorate_web_api_payload
+        else:
+            self._post = self._post_webhook
+            self._decorate_payload = self._decorate_webhook_payload
+
         if not self.webhook_url and not self.bot_token and self.enabled:
             logger.warning(
                 "Neither Slack webhook URL nor bot token provided. Slack notifications will be disabled."
@@ -131,6 +219,102 @@ class SlackNotificationProvider(NotificationProvider):
                 "For message threading, provide SLACK_BOT_TOKEN instead of webhook"
             )
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+
+        The client is bound to the event loop it was created in and must be
+        released with aclose() before that loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            # Its connections belong to a finished loop and cannot be closed
+            # from this one
+            logger.warning(
+                "Slack client of a previous event loop was not closed; "
+                "call aclose() before the loop ends"
+            )
+            self._client = None
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def _post_web_api(
+        self, client: httpx.AsyncClient, content: bytes
+    ) -> Optional[Dict[str, Any]]:
+        """Post a serialized payload to the Web API (supports threading)."""
+        headers = {
+            "Authorization": f"Bearer {self.bot_token}",
+            "Content-Type": "application/json",
+        }
+        response = await client.post(
+            "https://slack.com/api/chat.postMessage",
+            content=content,
+            headers=headers,
+        )
+        response.raise_for_status()
+
+        try:
+            result = response.json()
+            if result.get("ok"):
+                return result
+            else:
+                logger.error(f"Slack API error: {result.get('error', 'Unknown error')}")
+                return None
+        except json.JSONDecodeError:
+            logger.error("Invalid JSON response from Slack API")
+            return None
+
+    async def _post_webhook(
+        self, client: httpx.AsyncClient, content: bytes
+    ) -> Optional[Dict[str, Any]]:
+        """Post a serialized payload to the webhook (no threading)."""
+        if not self.webhook_url:
+            logger.error("No Slack webhook URL or bot token available")
+            return None
+
+        response = await client.post(
+            self.webhook_url,
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+        # Webhooks normally answer with the literal body "ok"
+        body = response.content
+        if body and body != b"ok":
+            try:
+                return json.loads(body)
+            except json.JSONDecodeError:
+                pass
+
+        return {"status": "ok"}
+
+    def _decorate_web_api_payload(
+        self, payload: Dict[str, Any], thread_id: Optional[str], icon_emoji: str
+    ):
+        """Thread the message; the Web API uses the bot's own name and icon."""
+        if thread_id and thread_id != "webhook_thread":
+            payload["thread_ts"] = thread_id
+
+    def _decorate_webhook_payload(
+        self, payload: Dict[str, Any], thread_id: Optional[str], icon_emoji: str
+    ):
+        """Set the sender identity; webhooks cannot thread."""
+        payload["username"] = self.username
+        payload["icon_emoji"] = icon_emoji
+
     async def _send_slack_message(
         self, payload: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -139,89 +323,68 @@ class SlackNotificationProvider(NotificationProvider):
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                if self.use_web_api and self.bot_token:
-                    # Use Web API for proper threading support
-                    headers = {
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    }
-                    response = await client.post(
-                        "https://slack.com/api/chat.postMessage",
-                        json=payload,
-                        headers=headers,
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-
-                    try:
-                        result = response.json()
-                        if result.get("ok"):
-                            return result
-                        else:
-                            logger.error(
-                                f"Slack API error: {result.get('error', 'Unknown error')}"
-                            )
-                            return None
-                    except json.JSONDecodeError:
-                        logger.error("Invalid JSON response from Slack API")
-                        return None
-
-                elif self.webhook_url:
-                    # Fallback to webhook (no threading)
-                    response = await client.post(
-                        self.webhook_url, json=payload, timeout=30.0
-                    )
-                    response.raise_for_status()
-
-                    if response.text and response.text != "ok":
-                        try:
-                            return json.loads(response.text)
-                        except json.JSONDecodeError:
-                            pass
-
-                    return {"status": "ok"}
-                else:
-                    logger.error("No Slack webhook URL or bot token available")
-                    return None
-
-        except Exception as e:
-            logger.error(f"Failed to send Slack notification: {e}")
+            return await self._post(self._get_client(), _dumps_payload(payload))
+        except (httpx.HTTPError, httpx.InvalidURL, TypeError) as e:
+            # InvalidURL is not an HTTPError, it covers malformed webhook URLs;
+            # TypeError covers payloads the JSON encoder rejects
+            logger.error("Failed to send Slack notification: %s", e)
             return None
 
+    # Static parts of the initial notification; copied per call, never mutated
+    _SUMMARY_SECTION_TEMPLATE = {"type": "section", "fields": []}
+    _CONTEXT_TEMPLATE = {"type": "context", "elements": []}
+
+    # Completion headers only differ by outcome; shared by every payload
+    _COMPLETION_HEADER_SUCCESS = {
+        "type": "header",
+        "text": {"type": "plain_text", "text": "✅ Analysis Completed"},
+    }
+    _COMPLETION_HEADER_FAILURE = {
+        "type": "header",
+        "text": {"type": "plain_text", "text": "❌ Analysis Failed"},
+    }
+
+    def _make_context_block(self, label: str) -> Dict[str, Any]:
+        """Build the trailing '<label> at <time> UTC' context block."""
+        context = copy.copy(self._CONTEXT_TEMPLATE)
+        context["elements"] = [
+            {"type": "mrkdwn", "text": f"{label} at {_utc_timestamp()}"}
+        ]
+        return context
+
     def _format_analysis_summary(self, summary: AnalysisSummary) -> Dict[str, Any]:
         """Format analysis summary for Slack."""
-        repo_name = os.path.basename(summary.repository_path.rstrip("/"))
+        repo_name = _repo_name(summary.repository_path)
 
-        blocks = [
+        fields = [
+            {"type": "mrkdwn", "text": "".join(("*Repository:* `", repo_name, "`"))},
             {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"🔍 Starting Analysis: {repo_name}",
-                },
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*Repository:* `{repo_name}`"},
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Type:* {summary.analysis_type.replace('_', ' ').title()}",
-                    },
-                ],
+                "type": "mrkdwn",
+                "text": "*Type:* " + summary.analysis_type.replace("_", " ").title(),
             },
         ]
 
         if summary.commit_hash:
-            blocks[1]["fields"].append(
+            fields.append(
                 {"type": "mrkdwn", "text": f"*Commit:* `{summary.commit_hash[:8]}`"}
             )
 
         if summary.branch:
-            blocks[1]["fields"].append(
-                {"type": "mrkdwn", "text": f"*Branch:* `{summary.branch}`"}
-            )
+            fields.append({"type": "mrkdwn", "text": f"*Branch:* `{summary.branch}`"})
+
+        section = copy.copy(self._SUMMARY_SECTION_TEMPLATE)
+        section["fields"] = fields
+
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "🔍 Starting Analysis: " + repo_name,
+                },
+            },
+            section,
+        ]
 
         if summary.task_description:
             blocks.append(
@@ -229,136 +392,131 @@ class SlackNotificationProvider(NotificationProvider):
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": f"*Task:* {summary.task_description}",
+                        "text": "*Task:* " + summary.task_description,
                     },
                 }
             )
 
         if summary.estimated_tasks:
-            task_list = "\n".join(f"• {task}" for task in summary.estimated_tasks[:10])
+            task_lines = ["*Planned Tasks:*"]
+            task_lines.extend(f"• {task}" for task in summary.estimated_tasks[:10])
             if len(summary.estimated_tasks) > 10:
-                task_list += (
-                    f"\n• ... and {len(summary.estimated_tasks) - 10} more tasks"
+                task_lines.append(
+                    f"• ... and {len(summary.estimated_tasks) - 10} more tasks"
                 )
 
             blocks.append(
                 {
                     "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Planned Tasks:*\n{task_list}",
-                    },
+                    "text": {"type": "mrkdwn", "text": "\n".join(task_lines)},
                 }
             )
 
-        blocks.append(
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"Started at {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC",
-                    }
-                ],
-            }
-        )
+        blocks.append(self._make_context_block("Started"))
 
-        return {
-            "channel": self.channel,
-            "username": self.username,
-            "icon_emoji": ":mag:",
-            "blocks": blocks,
-        }
+        return {"channel": self.channel, "blocks": blocks}
+
+    _EMOJI_MAP = {
+        "info": "ℹ️",
+        "success": "✅",
+        "warning": "⚠️",
+        "error": "❌",
+        "progress": "🔄",
+    }
 
     def _get_message_emoji(self, message_type: str) -> str:
         """Get emoji for message type."""
-        emoji_map = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "error": "❌",
-            "progress": "🔄",
-        }
-        return emoji_map.get(message_type, "ℹ️")
+        return self._EMOJI_MAP.get(message_type, "ℹ️")
 
     def _convert_markdown_to_slack(self, content: str) -> str:
         """Convert standard markdown to Slack mrkdwn format."""
-        import re
+        return self._markdown_to_slack(content)
 
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def _markdown_to_slack(cls, content: str) -> str:
+        """Cached markdown conversion; repeated status strings are common."""
         # Convert tables to Slack-friendly format
-        content = self._convert_tables_to_slack(content)
-
-        # Convert code blocks (```lang\ncode\n``` -> ```\ncode\n```)
-        content = re.sub(
-            r"```\w*\n(.*?)\n```", r"```\n\1\n```", content, flags=re.DOTALL
+        content = cls._convert_tables_to_slack(content)
+
+        # Convert code blocks, headers, **bold** and bullets in one pass;
+        # inline code and numbered lists are already valid Slack mrkdwn
+        return _MARKDOWN_TOKEN_RE.sub(_markdown_token_to_slack, content)
+
+    @staticmethod
+    def _is_table_row(line: str) -> bool:
+        """Whether a line looks like a markdown table row (| a | b |)."""
+        line = line.rstrip()
+        return len(line) > 2 and line[0] == "|" and line[-1] == "|"
+
+    @staticmethod
+    def _is_table_separator(line: str) -> bool:
+        """Whether a line is a markdown table header separator (|---|---|)."""
+        line = line.rstrip()
+        return (
+            len(line) > 2
+            and line[0] == "|"
+            and line[-1] == "|"
+            and not line.strip("-| \t")
         )
 
-        # Convert headers (## Header -> *Header*)
-        content = re.sub(r"^### (.+)$", r"*\1*", content, flags=re.MULTILINE)
-        content = re.sub(r"^## (.+)$", r"*\1*", content, flags=re.MULTILINE)
-        content = re.sub(r"^# (.+)$", r"*\1*", content, flags=re.MULTILINE)
+    @staticmethod
+    def _format_table_for_slack(lines: List[str]) -> str:
+        """Format header + data rows of a markdown table as Slack text."""
+        # Parse header row
+        header = [cell.strip() for cell in lines[0].strip().split("|")[1:-1]]
 
-        # Convert **bold** to *bold* - handle complex content with special chars
-        # Use non-greedy matching and handle newlines/special characters
-        content = re.sub(
-            r"\*\*([^*]+(?:\*(?!\*)[^*]*)*)\*\*", r"*\1*", content, flags=re.DOTALL
-        )
-
-        # Inline code (`code`) is already correct for Slack
-        # No change needed for `code`
+        # Format as structured text for Slack with better spacing
+        result = []
 
-        # Convert bullet points (- item -> • item)
-        content = re.sub(r"^-\s+(.+)$", r"• \1", content, flags=re.MULTILINE)
+        # Add each row with proper formatting and line breaks
+        for line in lines[1:]:
+            row = [cell.strip() for cell in line.strip().split("|")[1:-1]]
+            row_parts = []
+            for i, cell in enumerate(row):
+                if i < len(header):
+                    # Format as "Header: Value" with emoji conversion
+                    cell_formatted = cell.replace(":white_check_mark:", "✅")
+                    row_parts.append(f"*{header[i]}*: {cell_formatted}")
 
-        # Fix nested bullet points with proper spacing
-        content = re.sub(r"^(\s*)•\s+(.+)$", r"\1• \2", content, flags=re.MULTILINE)
+            # Join with line breaks instead of pipes for better readability
+            result.append("\n".join(f"  {part}" for part in row_parts))
 
-        # Convert numbered lists (1. item -> 1. item) - already correct
-        # No change needed
+        return "\n\n".join(result)
 
-        return content
-
-    def _convert_tables_to_slack(self, content: str) -> str:
+    @classmethod
+    def _convert_tables_to_slack(cls, content: str) -> str:
         """Convert markdown tables to Slack-friendly format."""
-        import re
-
-        def replace_table(match):
-            lines = match.group(0).strip().split("\n")
-            if len(lines) < 2:
-                return match.group(0)
-
-            # Parse header row
-            header = [cell.strip() for cell in lines[0].split("|")[1:-1]]
-
-            # Skip separator row (line 1)
-            data_rows = []
-            for line in lines[2:]:
-                if line.strip():
-                    row = [cell.strip() for cell in line.split("|")[1:-1]]
-                    data_rows.append(row)
-
-            # Format as structured text for Slack with better spacing
-            result = []
-
-            # Add each row with proper formatting and line breaks
-            for row in data_rows:
-                row_parts = []
-                for i, cell in enumerate(row):
-                    if i < len(header):
-                        # Format as "Header: Value" with emoji conversion
-                        cell_formatted = cell.replace(":white_check_mark:", "✅")
-                        row_parts.append(f"*{header[i]}*: {cell_formatted}")
-
-                # Join with line breaks instead of pipes for better readability
-                result.append("\n".join(f"  {part}" for part in row_parts))
-
-            return "\n\n".join(result)
-
-        # Match markdown tables (basic format)
-        table_pattern = r"^\|.+?\|\s*\n\|[-\s\|]+\|\s*\n(?:\|.+?\|\s*\n?)+"
-        content = re.sub(table_pattern, replace_table, content, flags=re.MULTILINE)
-
-        return content
+        # Most progress updates contain no table at all
+        if "|" not in content:
+            return content
+
+        lines = content.splitlines(keepends=True)
+        out = []
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            if (
+                i + 1 < len(lines)
+                and cls._is_table_row(line)
+                and cls._is_table_separator(lines[i + 1])
+            ):
+                # Collect data rows following the header separator
+                end = i + 2
+                while end < len(lines) and cls._is_table_row(lines[end]):
+                    end += 1
+
+                if end > i + 2:
+                    out.append(cls._format_table_for_slack([line] + lines[i + 2 : end]))
+                    if lines[end - 1].endswith("\n"):
+                        out.append("\n")
+                    i = end
+                    continue
+
+            out.append(line)
+            i += 1
+
+        return "".join(out)
 
     async def send_initial_notification(
         self, summary: AnalysisSummary
@@ -373,15 +531,7 @@ class SlackNotificationProvider(NotificationProvider):
             return self.thread_ts
 
         payload = self._format_analysis_summary(summary)
-
-        # Web API payload format
-        if self.use_web_api:
-            # Convert webhook format to Web API format
-            payload["channel"] = payload.pop("channel", self.channel)
-            if "username" in payload:
-                payload.pop("username")  # Not supported in Web API
-            if "icon_emoji" in payload:
-                payload.pop("icon_emoji")  # Use bot's default icon
+        self._decorate_payload(payload, None, ":mag:")
 
         response = await self._send_slack_message(payload)
 
@@ -411,16 +561,8 @@ class SlackNotificationProvider(NotificationProvider):
             "mrkdwn": True,
         }
 
-        # Web API format adjustments
-        if self.use_web_api:
-            # Always use the established thread_ts for threading
-            thread_id = self.thread_ts or message.thread_id
-            if thread_id and thread_id != "webhook_thread":
-                payload["thread_ts"] = thread_id
-        else:
-            # Webhook format
-            payload["username"] = self.username
-            payload["icon_emoji"] = ":gear:"
+        # Always use the established thread_ts for threading
+        self._decorate_payload(payload, self.thread_ts or message.thread_id, ":gear:")
 
         response = await self._send_slack_message(payload)
         return response is not None
@@ -432,24 +574,14 @@ class SlackNotificationProvider(NotificationProvider):
         if not self.enabled:
             return False
 
-        emoji = "✅" if success else "❌"
-        status = "Completed" if success else "Failed"
-
         blocks = [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": f"{emoji} Analysis {status}"},
-            },
+            (
+                self._COMPLETION_HEADER_SUCCESS
+                if success
+                else self._COMPLETION_HEADER_FAILURE
+            ),
             {"type": "section", "text": {"type": "mrkdwn", "text": summary}},
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"Finished at {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC",
-                    }
-                ],
-            },
+            self._make_context_block("Finished"),
         ]
 
         payload = {
@@ -458,13 +590,7 @@ class SlackNotificationProvider(NotificationProvider):
             "mrkdwn": True,
         }
 
-        # Web API vs Webhook format
-        if self.use_web_api:
-            if self.thread_ts and self.thread_ts != "webhook_thread":
-                payload["thread_ts"] = self.thread_ts
-        else:
-            payload["username"] = self.username
-            payload["icon_emoji"] = ":checkered_flag:"
+        self._decorate_payload(payload, self.thread_ts, ":checkered_flag:")
 
         response = await self._send_slack_message(payload)
         return response is not None
@@ -511,32 +637,59 @@ class NotificationManager:
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        self.providers: List[NotificationProvider] = []
+        self.enabled = self.config.get("enabled", True)
+        self._providers: Optional[List[NotificationProvider]] = None
+        self._any_enabled = False
         self.current_thread_id = None
         self.initial_notification_sent = False  # Track if initial notification was sent
 
-        # Initialize providers based on config
-        self._initialize_providers()
+        # Providers are only constructed on first use
+        self._provider_specs: List[Callable[[], NotificationProvider]] = []
+        self._collect_provider_specs()
+
+    def _collect_provider_specs(self):
+        """Collect provider factories from config without constructing them."""
+        if not self.enabled:
+            return
 
-    def _initialize_providers(self):
-        """Initialize notification providers from config."""
         providers_config = self.config.get("providers", {})
 
         # Slack provider
-        if providers_config.get("slack", {}).get("enabled", False) or os.getenv(
-            "SLACK_WEBHOOK_URL"
+        if (
+            providers_config.get("slack", {}).get("enabled", False)
+            or SLACK_ENV_CONFIGURED
         ):
             slack_config = providers_config.get("slack", {})
             slack_config.setdefault("enabled", True)
-            self.providers.append(SlackNotificationProvider(slack_config))
+            self._provider_specs.append(lambda: SlackNotificationProvider(slack_config))
+
+    def _ensure_providers(self) -> List[NotificationProvider]:
+        """Construct the configured providers on first use."""
+        if self._providers is None:
+            self._providers = [spec() for spec in self._provider_specs]
+
+            # If no providers configured, use dummy (unless disabled outright)
+            if not self._providers and self.enabled:
+                self._providers.append(DummyNotificationProvider())
+
+            self._any_enabled = any(p.enabled for p in self._providers)
+
+        return self._providers
+
+    @property
+    def providers(self) -> List[NotificationProvider]:
+        """Realized notification providers."""
+        return self._ensure_providers()
 
-        # If no providers configured, use dummy
-        if not self.providers:
-            self.providers.append(DummyNotificationProvider())
+    def _has_enabled_provider(self) -> bool:
+        """Whether any provider would actually send (cached, no provider scan)."""
+        self._ensure_providers()
+        return self._any_enabled
 
     def add_provider(self, provider: NotificationProvider):
         """Add a notification provider."""
-        self.providers.append(provider)
+        self._ensure_providers().append(provider)
+        self._any_enabled = self._any_enabled or provider.enabled
 
     async def send_initial_notification(self, summary: AnalysisSummary) -> bool:
         """Send initial notification through all providers (only once)."""
@@ -545,6 +698,11 @@ class NotificationManager:
             logger.debug("Initial notification already sent, skipping duplicate")
             return True
 
+        # Disabled providers have nothing to send; skip the provider loop
+        if not self._has_enabled_provider():
+            self.initial_notification_sent = bool(self._providers)
+            return self.initial_notification_sent
+
         success = False
         for provider in self.providers:
             try:
@@ -552,9 +710,10 @@ class NotificationManager:
                 if thread_id:
                     self.current_thread_id = thread_id
                 success = True
-            except Exception as e:
-                logger.error(
-                    f"Provider {provider.__class__.__name__} failed to send initial notification: {e}"
+            except Exception:
+                logger.exception(
+                    "Provider %s failed to send initial notification",
+                    provider.__class__.__name__,
                 )
 
         if success:
@@ -565,6 +724,9 @@ class NotificationManager:
         self, content: str, message_type: str = "info", title: Optional[str] = None
     ) -> bool:
         """Send progress update through all providers."""
+        if not self._has_enabled_provider():
+            return False
+
         message = NotificationMessage(
             content=content,
             title=title,
@@ -577,9 +739,10 @@ class NotificationManager:
             try:
                 if await provider.send_progress_update(message):
                     success = True
-            except Exception as e:
-                logger.error(
-                    f"Provider {provider.__class__.__name__} failed to send progress update: {e}"
+            except Exception:
+                logger.exception(
+                    "Provider %s failed to send progress update",
+                    provider.__class__.__name__,
                 )
 
         return success
@@ -588,14 +751,18 @@ class NotificationManager:
         self, summary: str, success: bool = True
     ) -> bool:
         """Send completion notification through all providers."""
+        if not self._has_enabled_provider():
+            return False
+
         result = False
         for provider in self.providers:
             try:
                 if await provider.send_completion_notification(summary, success):
                     result = True
-            except Exception as e:
-                logger.error(
-                    f"Provider {provider.__class__.__name__} failed to send completion notification: {e}"
+            except Exception:
+                logger.exception(
+                    "Provider %s failed to send completion notification",
+                    provider.__class__.__name__,
                 )
 
         return result
@@ -604,21 +771,30 @@ class NotificationManager:
         self, error: str, context: Optional[str] = None
     ) -> bool:
         """Send error notification through all providers."""
+        if not self._has_enabled_provider():
+            return False
+
         success = False
         for provider in self.providers:
             try:
                 if await provider.send_error_notification(error, context):
                     success = True
-            except Exception as e:
-                logger.error(
-                    f"Provider {provider.__class__.__name__} failed to send error notification: {e}"
+            except Exception:
+                logger.exception(
+                    "Provider %s failed to send error notification",
+                    provider.__class__.__name__,
                 )
 
         return success
 
+    async def aclose(self):
+        """Close all realized providers."""
+        for provider in self._providers or []:
+            await provider.aclose()
+
     def is_enabled(self) -> bool:
         """Check if any provider is enabled."""
-        return any(provider.enabled for provider in self.providers)
+        return self._has_enabled_provider()
 
 
 # Configuration helper
@@ -637,14 +813,16 @@ def load_notification_config(config_path: Optional[str] = None) -> Dict[str, Any
             )
 
     # Override with environment variables
-    if os.getenv("SLACK_WEBHOOK_URL") or os.getenv("SLACK_BOT_TOKEN"):
+    webhook_url = os.getenv("SLACK_WEBHOOK_URL")
+    bot_token = os.getenv("SLACK_BOT_TOKEN")
+    if webhook_url or bot_token:
         config.setdefault("providers", {})
         config["providers"].setdefault("slack", {})
         config["providers"]["slack"].update(
             {
                 "enabled": True,
-                "webhook_url": os.getenv("SLACK_WEBHOOK_URL"),
-                "bot_token": os.getenv("SLACK_BOT_TOKEN"),
+                "webhook_url": webhook_url,
+                "bot_token": bot_token,
                 "channel": os.getenv("SLACK_CHANNEL", "#general"),
                 "username": os.getenv("SLACK_USERNAME", "Logan Analyzer"),
             }
@@ -653,10 +831,39 @@ def load_notification_config(config_path: Optional[str] = None) -> Dict[str, Any
     return config
 
 
+def install_uvloop() -> bool:
+    """
+    Use uvloop for event loops created from now on, if it is installed.
+
+    The policy only applies to loops created afterwards, so this is a no-op
+    when called from inside a running loop. Callers that manage their own
+    loop can pass ``loop_factory=uvloop.new_event_loop`` to ``asyncio.Runner``.
+
+    Returns:
+        True if the uvloop policy is active
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    try:
+        asyncio.get_running_loop()
+        return False
+    except RuntimeError:
+        pass
+
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 # Factory function for easy initialization
 def create_notification_manager(
     config_path: Optional[str] = None,
 ) -> NotificationManager:
     """Create and configure notification manager."""
     config = load_notification_config(config_path)
+    if config.get("use_uvloop", True):
+        install_uvloop()
     return NotificationManager(config)
@@ -1,29 +1,63 @@
 #!/usr/bin/env python3
 
-import json
+import base64
 import os
-import sys
 import time
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from loguru import logger
 from firefox_cdp import FirefoxCDP
 
+DEFAULT_TARGET_ID = "BB51B5A614864DE8A273A54F159257DA"
+# DEFAULT_TARGET_ID = 'DE92C2FB8E59CE8A159FA25155D84B34'
+# DEFAULT_TARGET_ID = '4ADF5C335390A4CC1F1501D37E2B73DF'
+
+# How long to wait for an email to render (or the login form to show up)
+EMAIL_LOAD_TIMEOUT_MS = 30000
+
+PDF_PRINT_OPTIONS = {
+    "printBackground": False,
+    "preferCSSPageSize": False,
+    "marginTop": 0.4,
+    "marginBottom": 0.4,
+    "marginLeft": 0.4,
+    "marginRight": 0.4,
+    "paperWidth": 8.27,  # A4 width in inches
+    "paperHeight": 11.69,  # A4 height in inches
+    "transferMode": "ReturnAsStream",
+}
+
+# Bytes requested per IO.read when streaming a PDF
+PDF_READ_CHUNK_SIZE = 1 << 20
+
 
 class OutlookExporter:
-    def __init__(self, output_dir="exported_emails"):
+    def __init__(self, output_dir="exported_emails", target_id=DEFAULT_TARGET_ID):
         self.output_dir = output_dir
+        self.target_id = target_id
         self.firefox = None
+        self._domains_enabled = False
+        self._top_frame_id = None
 
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
 
+    def __enter__(self):
+        if not self.start_browser():
+            raise RuntimeError("Failed to connect to Firefox CDP")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def start_browser(self):
-        """Start Firefox browser with CDP enabled"""
+        """Start Firefox browser with CDP enabled (no-op if already connected)"""
+        if self.firefox:
+            return True
+
         logger.info("Starting Firefox browser with CDP enabled")
 
-        target_id = "BB51B5A614864DE8A273A54F159257DA"
-        # target_id = 'DE92C2FB8E59CE8A159FA25155D84B34'
-        # target_id = '4ADF5C335390A4CC1F1501D37E2B73DF'
+        target_id = self.target_id
         self.firefox = FirefoxCDP(
             ws_url=f"ws://host.docker.internal:9223/devtools/page/{target_id}",
             port=9222,
@@ -36,12 +70,18 @@ class OutlookExporter:
 
         if not self.firefox.connect():
             logger.error("Failed to connect to Firefox CDP")
+            self.firefox = None
             return False
 
-        # Enable necessary domains
-        self.firefox.send_command("Page.enable")
-        self.firefox.send_command("DOM.enable")
-        self.firefox.send_command("Runtime.enable")
+        # Enable necessary domains once per connection
+        if not self._domains_enabled:
+            self.firefox.send_command("Page.enable")
+            self.firefox.send_command("DOM.enable")
+            self.firefox.send_command("Runtime.enable")
+            self._domains_enabled = True
+
+        # The top-level frame id is stable for the lifetime of the target
+        self._top_frame_id = self._fetch_top_frame_id()
 
         if False:
             targets = self.firefox.send_command("Target.getTargets", {})
@@ -126,11 +166,148 @@ class OutlookExporter:
 
         return True
 
+    def _fetch_top_frame_id(self):
+        """Look up the id of the target's top-level frame"""
+        frame_tree = self.firefox.send_command("Page.getFrameTree", {})
+        return (frame_tree or {}).get("frameTree", {}).get("frame", {}).get("id")
+
+    def _print_to_pdf(self, file_path, session_id=None):
+        """Print the page to file_path, streaming the PDF through the IO domain
+
+        Returns:
+            bool: True if the PDF was written
+        """
+        pdf_data = self.firefox.send_command(
+            "Page.printToPDF", PDF_PRINT_OPTIONS, session_id=session_id
+        )
+        if not pdf_data:
+            return False
+
+        handle = pdf_data.get("stream")
+        if handle:
+            try:
+                with open(file_path, "wb") as f:
+                    while True:
+                        chunk = self.firefox.send_command(
+                            "IO.read",
+                            {"handle": handle, "size": PDF_READ_CHUNK_SIZE},
+                            session_id=session_id,
+                        )
+                        if not chunk:
+                            raise Exception("Failed to read PDF stream")
+
+                        data = chunk.get("data", "")
+                        if chunk.get("base64Encoded"):
+                            f.write(base64.b64decode(data))
+                        else:
+                            f.write(data.encode("utf-8"))
+
+                        if chunk.get("eof"):
+                            return True
+            finally:
+                self.firefox.send_command(
+                    "IO.close", {"handle": handle}, session_id=session_id
+                )
+
+        # Browsers without stream support still return the PDF inline
+        if "data" in pdf_data:
+            with open(file_path, "wb") as f:
+                f.write(base64.b64decode(pdf_data["data"]))
+            return True
+
+        return False
+
+    def _print_iframe_target(self, file_path, email_id=None):
+        """Print the email iframe to PDF through its own target session
+
+        Only out-of-process iframes are exposed as targets. Target.getTargets
+        lists the iframes of the whole browser, so only iframes whose URL
+        contains email_id, or that belong to this page, are used. Returns
+        False if there is no such iframe target or none can be printed, in
+        which case the caller falls back to printing the top frame.
+        """
+        owners = {self.target_id, self._top_frame_id} - {None}
+
+        def is_email_iframe(target):
+            if target.get("type") != "iframe":
+                return False
+            if email_id and email_id in target.get("url", ""):
+                return True
+            return bool(owners & {target.get("openerId"), target.get("parentId")})
+
+        targets = self.firefox.send_command("Target.getTargets", {})
+        iframes = [
+            target
+            for target in (targets or {}).get("targetInfos", [])
+            if is_email_iframe(target)
+        ]
+
+        for target in iframes:
+            result = self.firefox.send_command(
+                "Target.attachToTarget",
+                {"targetId": target.get("targetId"), "flatten": True},
+            )
+            session_id = (result or {}).get("sessionId")
+            if not session_id:
+                continue
+
+            try:
+                return self._print_to_pdf(file_path, session_id=session_id)
+            finally:
+                self.firefox.send_command(
+                    "Target.detachFromTarget", {"sessionId": session_id}
+                )
+
+        return False
+
+    def _get_iframe_html(self):
+        """Return the outer HTML of the email iframe's document element
+
+        Reads the markup through the DOM domain (DOM.getOuterHTML) instead of
+        serializing it inside the page with Runtime.evaluate. Falls back to
+        Runtime.evaluate when the DOM lookup is not supported.
+        """
+        document = self.firefox.send_command("DOM.getDocument", {"depth": 0})
+        root_id = (document or {}).get("root", {}).get("nodeId")
+
+        if root_id:
+            iframe = self.firefox.send_command(
+                "DOM.querySelector", {"nodeId": root_id, "selector": "iframe"}
+            )
+            iframe_id = (iframe or {}).get("nodeId")
+
+            if iframe_id:
+                # contentDocument is only described when piercing into frames
+                node = self.firefox.send_command(
+                    "DOM.describeNode", {"nodeId": iframe_id, "pierce": True}
+                )
+                content_document = (node or {}).get("node", {}).get("contentDocument")
+                backend_node_id = (content_document or {}).get("backendNodeId")
+                if backend_node_id:
+                    result = self.firefox.send_command(
+                        "DOM.getOuterHTML", {"backendNodeId": backend_node_id}
+                    )
+                    if result and result.get("outerHTML"):
+                        return result["outerHTML"]
+
+        result = self.firefox.send_command(
+            "Runtime.evaluate",
+            {
+                "expression": """
+                document.querySelector('iframe').contentWindow.document.documentElement.outerHTML
+            """,
+                "returnByValue": True,
+            },
+        )
+        return (result or {}).get("result", {}).get("value")
+
     def export_email_to_pdf(self, email_id, webLink=None, filename=None):
-        self.start_browser()
+        """Export an email to PDF by navigating directly to its Outlook Web App URL
 
-        """Export an email to PDF by navigating directly to its Outlook Web App URL"""
-        if not self.firefox and False:
+        The browser session is reused across calls; use the exporter as a
+        context manager (or call start_browser once) to export many emails.
+        """
+        if not self.firefox and not self.start_browser():
             logger.error("Firefox browser not started")
             return None
 
@@ -143,51 +320,68 @@ class OutlookExporter:
         # Navigate to the email URL
         self.firefox.navigate_to_url(url)
 
-        # Wait for authentication if needed
-        # This is a simplified approach - in a real implementation, you would need to handle authentication
-        time.sleep(5)  # Give time for the page to load and possibly authenticate
+        # Wait for the page (or the login redirect) to finish loading instead
+        # of sleeping a fixed amount of time
+        self.firefox.wait_for_method("Page.loadEventFired", timeout=10)
 
-        # Check if we need to authenticate
-        auth_check = self.firefox.send_command(
+        # Wait for the email to fully render and open the print view. The
+        # authentication check is folded into the same evaluation to save a
+        # round trip: the promise resolves with needsAuth=true as soon as the
+        # login form is shown, which may only happen after a client-side
+        # redirect. It gives up after EMAIL_LOAD_TIMEOUT_MS.
+        logger.info("Waiting for email content to load...")
+        result = self.firefox.send_command(
             "Runtime.evaluate",
-            {"expression": "document.querySelector('input[type=email]') !== null"},
+            {
+                "expression": """
+            new Promise(resolve => {
+                const needsAuth = () => document.querySelector('input[type=email]') !== null;
+                const isLoaded = () => {
+                    const emailBody = document.querySelector('#ItemReadingPaneContainer');
+                    return emailBody && emailBody.children.length > 0;
+                };
+
+                let observer = null;
+                let timer = null;
+                const done = (state) => {
+                    if (observer) observer.disconnect();
+                    clearTimeout(timer);
+                    resolve(state);
+                };
+                const check = () => {
+                    if (needsAuth()) {
+                        done({needsAuth: true});
+                        return true;
+                    }
+                    if (isLoaded()) {
+                        document.querySelector('button[aria-label^="Print"]').click();
+                        done({needsAuth: false});
+                        return true;
+                    }
+                    return false;
+                };
+
+                if (check()) return;
+                observer = new MutationObserver(check);
+                observer.observe(document.body, {childList: true, subtree: true});
+                timer = setTimeout(() => done({timedOut: true}), %d);
+            })
+            """
+                % EMAIL_LOAD_TIMEOUT_MS,
+                "awaitPromise": True,
+                "returnByValue": True,
+            },
         )
 
-        if auth_check and auth_check.get("result", {}).get("value", False):
+        state = (result or {}).get("result", {}).get("value") or {}
+        if state.get("needsAuth"):
             logger.warning(
                 "Authentication required. Please log in manually and run again."
             )
             return None
-
-        # Wait for the email content to load
-        logger.info("Waiting for email content to load...")
-        # time.sleep(3)  # Adjust as needed
-
-        # Wait for the email to fully render
-        logger.info("Runtime Evaluate")
-
-        if True:
-            self.firefox.send_command(
-                "Runtime.evaluate",
-                {
-                    "expression": """
-                new Promise(resolve => {
-                    // Check if email content is loaded
-                    const checkLoaded = () => {
-                        const emailBody = document.querySelector('#ItemReadingPaneContainer');
-                        if (emailBody && emailBody.children.length > 0) {
-                            document.querySelector('button[aria-label^="Print"]').click();
-                            resolve(true);
-                        } else {
-                            setTimeout(checkLoaded, 500);
-                        }
-                    };
-                    checkLoaded();
-                })
-                """,
-                    "awaitPromise": True,
-                },
-            )
+        if state.get("timedOut"):
+            logger.error(f"Timed out waiting for email {email_id} to load")
+            return None
 
         window = self.firefox.wait_for_method("Page.documentOpened")
         print(window)
@@ -263,8 +457,6 @@ class OutlookExporter:
             )
 
             try:
-                import base64
-
                 with open(file_path, "wb") as f:
                     f.write(base64.b64decode(result["content"]))
 
@@ -280,64 +472,100 @@ class OutlookExporter:
 
         file_path = os.path.join(self.output_dir, filename)
 
-        result = self.firefox.send_command(
-            "Runtime.evaluate",
-            {
-                "expression": """
-                document.querySelector('iframe').contentWindow.document.documentElement.outerHTML
-            """,
-                "returnByValue": True,
-            },
-        )
+        # Generate PDF using CDP
+        logger.info("Generating PDF...")
 
-        content = result.get("result").get("value")
-        print("RESULT", content)
+        # Print the email iframe directly when it is its own target; this
+        # avoids copying its HTML into the top frame and laying it out again
+        try:
+            printed = self._print_iframe_target(file_path, email_id=email_id)
+        except Exception as e:
+            logger.warning(f"Could not print iframe target: {str(e)}")
+            printed = False
 
-        if not content:
-            raise Exception("Could not find iframe")
+        # Otherwise copy its HTML into the top frame, where it is laid out
+        # over as many pages as it needs
+        if not printed:
+            content = self._get_iframe_html()
 
-        frame_tree = self.firefox.send_command("Page.getFrameTree", {})
-        frame_id = frame_tree.get("frameTree", {}).get("frame", {}).get("id")
+            if not content:
+                raise Exception("Could not find iframe")
 
-        self.firefox.send_command(
-            "Page.setDocumentContent",
-            {
-                "html": content,
-                "frameId": frame_id,
-            },
-        )
+            if self._top_frame_id is None:
+                self._top_frame_id = self._fetch_top_frame_id()
 
-        # Generate PDF using CDP
-        logger.info("Generating PDF...")
-        pdf_data = self.firefox.send_command(
-            "Page.printToPDF",
-            {
-                "printBackground": False,
-                "preferCSSPageSize": False,
-                "marginTop": 0.4,
-                "marginBottom": 0.4,
-                "marginLeft": 0.4,
-                "marginRight": 0.4,
-                "paperWidth": 8.27,  # A4 width in inches
-                "paperHeight": 11.69,  # A4 height in inches
-            },
-        )
+            self.firefox.send_command(
+                "Page.setDocumentContent",
+                {
+                    "html": content,
+                    "frameId": self._top_frame_id,
+                },
+            )
+
+            try:
+                printed = self._print_to_pdf(file_path)
+            except Exception as e:
+                logger.error(f"Error saving PDF: {str(e)}")
+                return None
 
-        if not pdf_data or "data" not in pdf_data:
+        if not printed:
             logger.error("Failed to generate PDF")
             return None
 
-        try:
-            import base64
+        logger.info(f"PDF saved to {file_path}")
+        return file_path
 
-            with open(file_path, "wb") as f:
-                f.write(base64.b64decode(pdf_data["data"]))
+    def export_emails_parallel(self, emails, workers=4):
+        """Export several emails concurrently, one browser tab per worker
 
-            logger.info(f"PDF saved to {file_path}")
-            return file_path
-        except Exception as e:
-            logger.error(f"Error saving PDF: {str(e)}")
-            return None
+        Each worker gets its own tab (created with Target.createTarget on the
+        shared browser) and its own CDP connection to it, so commands of
+        different workers never interleave on one WebSocket.
+
+        Args:
+            emails (list): Graph API messages, dicts with "id" and optionally "webLink"
+            workers (int): Number of tabs to export with
+
+        Returns:
+            list: The PDF path (or None on failure) for each email, in input order
+        """
+        emails = list(emails)
+        if not emails or not self.start_browser():
+            return [None] * len(emails)
+
+        tabs = Queue()
+        target_ids = []
+        for _ in range(min(workers, len(emails))):
+            result = self.firefox.send_command(
+                "Target.createTarget", {"url": "about:blank"}
+            )
+            target_id = (result or {}).get("targetId")
+            if target_id:
+                target_ids.append(target_id)
+                tabs.put(OutlookExporter(self.output_dir, target_id=target_id))
+
+        if not target_ids:
+            logger.error("Failed to create browser tabs for parallel export")
+            return [None] * len(emails)
+
+        def export(email):
+            tab = tabs.get()
+            try:
+                return tab.export_email_to_pdf(email["id"], email.get("webLink"))
+            except Exception as e:
+                logger.error(f"Error exporting email {email['id']}: {str(e)}")
+                return None
+            finally:
+                tabs.put(tab)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(target_ids)) as executor:
+                return list(executor.map(export, emails))
+        finally:
+            while not tabs.empty():
+                tabs.get().close()
+            for target_id in target_ids:
+                self.firefox.send_command("Target.closeTarget", {"targetId": target_id})
 
     def send_keyboard_shortcut(self, key_combination):
         """Send keyboard shortcuts to the active window
@@ -377,3 +605,5 @@ class OutlookExporter:
         if self.firefox:
             self.firefox.close()
             self.firefox = None
+            self._domains_enabled = False
+            self._top_frame_id = None
@@ -1,18 +1,127 @@
 from typing import List, Tuple
 from dataclasses import dataclass
+import bisect
+import itertools
 import logging
+import re
+import string
+from functools import lru_cache
 
 logger = logging.getLogger(f"{__name__}")
-logger.setLevel(logging.DEBUG)
 
 
-def check_line(n, h):
-    import string
+# ignore line endings like .,. This helps for example with extending arrays.
+_LINE_STRIP_CHARS = string.whitespace + ".,"
+
+# hunk line kinds
+CTX = " "
+ADD = "+"
+DEL = "-"
+
+
+@lru_cache(maxsize=4096)
+def line_key(line: str) -> str:
+    """Comparison key of a line, as used by check_line."""
+    return line.strip(_LINE_STRIP_CHARS)
 
-    # ignore line endings like .,. This helps for example with extending arrays.
-    if h.strip(string.whitespace + ".,") != n.strip(string.whitespace + ".,"):
+
+def check_line(n, h):
+    return line_key(h) == line_key(n)
+
+
+@dataclass(frozen=True, slots=True)
+class HunkLine:
+    """A hunk line classified once, with its comparison keys precomputed."""
+
+    kind: str
+    text: str  # the full diff line, including any +/- prefix
+    payload: str  # the line without its +/- prefix
+    key: str  # line_key(text)
+    payload_key: str  # line_key(payload)
+    blank: bool  # text.strip() == ""
+
+    @classmethod
+    def from_diff_line(cls, line: str) -> "HunkLine":
+        kind = line[0] if line[:1] in (ADD, DEL) else CTX
+        payload = line[1:] if kind != CTX else line
+        return cls(
+            kind=kind,
+            text=line,
+            payload=payload,
+            key=line_key(line),
+            payload_key=line_key(payload),
+            blank=line.strip() == "",
+        )
+
+
+def hunk_already_applied(
+    content_lines: List[str], content_keys: List[str], hunk: List[HunkLine]
+) -> bool:
+    """Check if the hunk's additions are already present in the content."""
+    # every added line must occur somewhere for the hunk to be applied already
+    present = set(content_keys)
+    if any(line.kind == ADD and line.payload_key not in present for line in hunk):
         return False
-    return True
+
+    # every added and non-blank context line consumes a content line, so no
+    # match can start later than n - required
+    n = len(content_lines)
+    required = sum(
+        1 for line in hunk if line.kind == ADD or (line.kind == CTX and not line.blank)
+    )
+
+    for i in range(min(n, n - required + 1)):
+        j = 0
+
+        valid = True
+
+        for line in hunk:
+            if line.kind == ADD:
+                # we expect this line here, if already applied
+                if i + j < n and content_keys[i + j] == line.payload_key:
+                    logger.debug(
+                        "test_if_already_applied: %s %d: valid", line.text, i + j
+                    )
+                    valid = valid and True
+                else:
+                    logger.debug(
+                        "test_if_already_applied: %s %d: invalid", line.text, i + j
+                    )
+                    valid = False
+            elif line.kind == DEL and i + j < n:
+                # we don't expect this line here, if already applied;
+                # deleted lines are skipped either way
+                logger.debug(
+                    "test_if_already_applied: %s %d: skipped", line.text, i + j
+                )
+                continue
+            elif i + j < n and content_keys[i + j] == line.key:
+                logger.debug("test_if_already_applied: %s %d: valid", line.text, i + j)
+                valid = valid and True
+            elif i + j < n and j > 0 and content_lines[i + j].strip() == "":
+                # update j, not line
+                pass
+            elif j > 0 and line.blank:
+                # no j update
+                continue
+            else:
+                logger.debug(
+                    "test_if_already_applied: %s %d: invalid", line.text, i + j
+                )
+                valid = False
+
+            if not valid:
+                break
+
+            j += 1
+
+        if not valid:
+            continue
+
+        logger.debug("test_if_already_applied: VALID")
+        return True
+
+    return False
 
 
 class PatchUtils:
@@ -61,153 +170,93 @@ class PatchUtils:
 
         return source_file, target_file, hunks
 
+    @staticmethod
+    def classify_hunk(hunk: List[str]) -> List[HunkLine]:
+        return [HunkLine.from_diff_line(line) for line in hunk]
+
+    @staticmethod
+    def find_exact_anchors(content_keys: List[str], hunk: List[HunkLine]) -> List[int]:
+        """
+        Find every line index where the hunk's context and deleted lines
+        occur verbatim (by comparison key) as consecutive content lines.
+        """
+        pattern = [line.payload_key for line in hunk if line.kind != ADD]
+        if not pattern:
+            return []
+
+        # search line-aligned, so surround both with separators
+        haystack = "\n" + "\n".join(content_keys) + "\n"
+        needle = "\n" + "\n".join(pattern) + "\n"
+
+        # offset of the separator preceding each content line
+        offsets = list(
+            itertools.accumulate((len(key) + 1 for key in content_keys[:-1]), initial=0)
+        )
+
+        anchors = []
+        pos = haystack.find(needle)
+        while pos != -1:
+            anchors.append(bisect.bisect_left(offsets, pos))
+            pos = haystack.find(needle, pos + 1)
+        return anchors
+
     @staticmethod
     def apply_patch_to_ytext(content, diff_text: str) -> str:
         _, _, hunks = PatchUtils.parse_unified_diff(diff_text)
-        content_lines = str(content).split("\n")
+        # content is only materialized once; edits below are applied to it
+        # one by one so collaborative (CRDT) history stays granular
+        text = str(content)
+        content_lines = text.split("\n")
+        # comparison keys of content_lines, kept in sync with it
+        content_keys = [line_key(line) for line in content_lines]
+
+        # Byte offset of the start of every line in content, kept in sync with
+        # the edits below so line positions never require rescanning content
+        buf = text.encode("utf-8")
+        del text
+        line_starts = [0] + [m.end() for m in re.finditer(b"\n", buf)]
+        content_size = len(buf)
+        del buf
 
         totals = [None] * len(hunks)
 
-        for hunk_index, hunk in enumerate(hunks):
-            found_indices = []
-
-            additions = 0
-            deletions = 0
+        for hunk_index, raw_hunk in enumerate(hunks):
+            hunk = PatchUtils.classify_hunk(raw_hunk)
 
             # Check if hunk contains any additions or deletions
-            for line in hunk:
-                if len(line) > 0 and line[0] == "+":
-                    additions += 1
-                elif len(line) > 0 and line[0] == "-":
-                    deletions += 1
-
-            # totals[hunk_index] = {'additions': additions, 'deletions': deletions }
-
-            if additions == 0 and deletions == 0:
+            if all(line.kind == CTX for line in hunk):
                 # totals[hunk_index] = { **totals[hunk_index], "error": f"Hunk {hunk_index} contains no added or deleted lines. Make sure to start the line with plus (+) to add, use minus (-) to delete." }
                 continue
 
-            # check if the patch is already applied
-            def test_if_already_applied():
-                is_valid = False
-
-                for i in range(len(content_lines)):
-                    j = 0
-
-                    valid = True
-
-                    for line in hunk:
-                        if len(line) > 0 and line[0] == "+":
-                            # we expect this line here, if already applied
-                            if i + j < len(content_lines) and check_line(
-                                content_lines[i + j], line[1:]
-                            ):
-                                logger.debug(
-                                    f"test_if_already_applied: {line[0:]} {i + j}: valid"
-                                )
-                                valid = valid and True
-                            else:
-                                logger.debug(
-                                    f"test_if_already_applied: {line[0:]} {i + j}: invalid"
-                                )
-                                valid = False
-                        elif (
-                            len(line) > 0
-                            and line[0] in ["-"]
-                            and i + j < len(content_lines)
-                        ):
-                            # we don't expect this line here, if already applied
-                            if i + j < len(content_lines) and check_line(
-                                content_lines[i + j], line[1:]
-                            ):
-                                logger.debug(
-                                    f"test_if_already_applied: {line[0:]} {i + j}: invalid"
-                                )
-                                # valid = False
-                                continue
-                            else:
-                                logger.debug(
-                                    f"test_if_already_applied: {line[0:]} {i + j}: valid"
-                                )
-                                valid = valid and True
-                                continue
-                        elif i + j < len(content_lines) and check_line(
-                            content_lines[i + j], line[0:]
-                        ):
-                            logger.debug(
-                                f"test_if_already_applied: {line[0:]} {i + j}: valid"
-                            )
-                            valid = valid and True
-                        elif (
-                            i + j < len(content_lines)
-                            and j > 0
-                            and content_lines[i + j].strip() == ""
-                        ):
-                            # update j, not line
-                            pass
-                        elif j > 0 and line.strip() == "":
-                            # no j update
-                            continue
-                        else:
-                            logger.debug(
-                                f"test_if_already_applied: {line[0:]} {i + j}: invalid"
-                            )
-                            valid = False
-
-                        if not valid:
-                            break
-
-                        j += 1
-
-                    if not valid:
-                        continue
-
-                    logger.debug(f"test_if_already_applied: VALID")
-                    return True
-
-                return False
-
-            if test_if_already_applied():
+            if hunk_already_applied(content_lines, content_keys, hunk):
                 logger.warn(
                     "test_if_already_applied: The patch has been applied already"
                 )
                 # totals[hunk_index] = { 'error': f"Hunk {hunk_index} has been applied already"}
                 continue
 
-            # search for start of hunk
-            for i in range(len(content_lines)):
+            # every non-blank context or deleted line consumes a content line,
+            # so no match can start later than n - required
+            n = len(content_lines)
+            required = sum(1 for line in hunk if line.kind != ADD and not line.blank)
+
+            # match the hunk against the content starting at line i
+            def hunk_matches_at(i, report=False):
                 j = 0
 
                 valid = True
 
                 for line in hunk:
-                    if i + j < len(content_lines) and check_line(
-                        content_lines[i + j], line[0:]
-                    ):
+                    if i + j < n and content_keys[i + j] == line.key:
                         valid = valid and True
-                    elif len(line) > 0 and line[0] == "+":
-                        if (
-                            i + j < len(content_lines)
-                            and check_line(content_lines[i + j], line[1:])
-                            and False
-                        ):
-                            valid = valid and True
-                        else:
-                            continue
-                    elif (
-                        len(line) > 0
-                        and line[0] in ["-"]
-                        and i + j < len(content_lines)
-                    ):
-                        valid = valid and check_line(content_lines[i + j], line[1:])
-                    elif (
-                        i + j < len(content_lines)
-                        and j > 0
-                        and content_lines[i + j].strip() == ""
-                    ):
+                    elif line.kind == ADD:
+                        continue
+                    elif line.kind == DEL and i + j < n:
+                        valid = valid and content_keys[i + j] == line.payload_key
+                    elif i + j < n and j > 0 and content_lines[i + j].strip() == "":
                         # update j, not line
                         pass
-                    elif j > 0 and line.strip() == "":
+                    elif j > 0 and line.blank:
                         # no j update
                         continue
                     else:
@@ -216,54 +265,56 @@ class PatchUtils:
                     # print("PATCH", hunk_index, "i", i,  "j", j, content_lines[i+j], line)
 
                     if not valid:
-                        if i > 0:
+                        if report and i > 0 and logger.isEnabledFor(logging.DEBUG):
                             # at least one match
-                            if i + j >= len(content_lines):
+                            if i + j >= n:
                                 got = "END"
                             else:
                                 got = content_lines[i + j]
 
-                            print(
-                                "PATCH",
+                            logger.debug(
+                                "PATCH %d i %d j %d GOT %r EXPECTED %r HUNK %r NOT VALID",
                                 hunk_index,
-                                "i",
                                 i,
-                                "j",
                                 j,
-                                "GOT",
                                 got,
-                                "EXPECTED",
-                                line,
-                                "HUNK",
-                                hunk,
-                                "NOT VALID",
+                                line.text,
+                                raw_hunk,
                             )
                         break
 
                     j += 1
 
-                if not valid:
-                    continue
-
-                print(
-                    "FOUND PATCH",
-                    hunk_index,
-                    "i",
-                    i,
-                    "j",
-                    j,
-                    "CONTENT",
-                    content_lines[i : i + j],
-                    "HUNK",
-                    hunk,
-                    "VALID",
-                )
+                if valid and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "FOUND PATCH %d i %d j %d CONTENT %r HUNK %r VALID",
+                        hunk_index,
+                        i,
+                        j,
+                        content_lines[i : i + j],
+                        raw_hunk,
+                    )
 
-                found_indices.append(i)
+                return valid
+
+            # search for start of hunk: exact matches of the context and
+            # deleted lines first, the line-by-line fuzzy scan only if none
+            found_indices = [
+                i
+                for i in PatchUtils.find_exact_anchors(content_keys, hunk)
+                if hunk_matches_at(i)
+            ]
+            if not found_indices:
+                found_indices = [
+                    i
+                    for i in range(min(n, n - required + 1))
+                    if hunk_matches_at(i, report=True)
+                ]
 
             if len(found_indices) == 0:
-                print(
-                    f"Hunk {hunk_index} cannot be applied: context mismatch, could not find text to update. Include the lines before and after the lines you want to add or delete (prepend with a space). When adding prefix the line with a plus (+) and when deleting prefix with a minus (-). Try to use different context, use smaller hunks. "
+                logger.debug(
+                    "Hunk %d cannot be applied: context mismatch, could not find text to update",
+                    hunk_index,
                 )
                 totals[hunk_index] = {
                     "error": f"Hunk {hunk_index} cannot be applied: context mismatch, could not find text to update. Include the lines before and after the lines you want to add or delete (prepend with a space). When adding prefix the line with a plus (+) and when deleting prefix with a minus (-). Try to use different context, use smaller hunks and verify the exact content of the file before creating the patch."
@@ -271,8 +322,10 @@ class PatchUtils:
                 continue
 
             if len(found_indices) > 1:
-                print(
-                    f"Hunk {hunk_index} cannot be applied: multiple matching locations found: {repr(found_indices)}"
+                logger.debug(
+                    "Hunk %d cannot be applied: multiple matching locations found: %r",
+                    hunk_index,
+                    found_indices,
                 )
                 totals[hunk_index] = {
                     "error": f"Hunk {hunk_index} cannot be applied: multiple matching locations found"
@@ -283,62 +336,62 @@ class PatchUtils:
 
             # the plus 1 is for line endings.
             for line in hunk:
-                if i < len(content_lines) and check_line(content_lines[i], line[0:]):
-                    print(f"PATCH found", line[0:])
+                if i < len(content_lines) and content_keys[i] == line.key:
+                    logger.debug("PATCH found %s", line.text)
                     i += 1
-                elif len(line) > 0 and line[0] == "-":
-                    pos = 0
-                    for j in range(i):
-                        if (a := str(content).encode("utf-8").find(b"\n", pos)) != -1:
-                            pos = a + 1
-                        else:
-                            raise Exception("Could not find line to delete")
+                elif line.kind == DEL:
+                    if i >= len(line_starts):
+                        raise Exception("Could not find line to delete")
+                    pos = line_starts[i]
 
                     # if has line ending
-                    length = len(str(content).encode("utf-8")) - pos
-                    if (b := str(content).encode("utf-8").find(b"\n", pos)) != -1:
-                        length = b + 1 - pos
+                    if i + 1 < len(line_starts):
+                        length = line_starts[i + 1] - pos
+                        del line_starts[i + 1]
+                        for k in range(i + 1, len(line_starts)):
+                            line_starts[k] -= length
+                    else:
+                        length = content_size - pos
 
-                    print(f"PATCH deleting {pos}", pos, length)
+                    logger.debug("PATCH deleting %d %d", pos, length)
                     del content[pos : pos + length]
-                    content_lines = content_lines[:i] + content_lines[i + 1 :]
-                elif len(line) > 0 and line[0] == "+":
-                    if (
-                        i < len(content_lines)
-                        and check_line(content_lines[i], line[1:])
-                        and False
-                    ):
-                        # line already added
-                        i += 1
-                        continue
-
+                    content_size -= length
+                    del content_lines[i]
+                    del content_keys[i]
+                elif line.kind == ADD:
                     # add
 
-                    # convert line into pos
-                    pos = 0
-                    for j in range(i):
-                        if (a := str(content).encode("utf-8").find(b"\n", pos)) != -1:
-                            pos = a + 1
-                        else:
-                            pos = len(str(content).encode("utf-8"))
-                            content.insert(pos, "\n")
-                            pos += 1
-
-                    print(f"PATCH adding {pos}", line[1:] + "\n")
-                    content.insert(pos, line[1:] + "\n")
-
-                    content_lines.insert(i, line[1:])
+                    # convert line into pos, padding content with newlines
+                    # when the line lies beyond the end
+                    while len(line_starts) <= i:
+                        content.insert(content_size, "\n")
+                        content_size += 1
+                        line_starts.append(content_size)
+                    pos = line_starts[i]
+
+                    logger.debug("PATCH adding %d %s", pos, line.payload)
+                    content.insert(pos, line.payload + "\n")
+
+                    length = len((line.payload + "\n").encode("utf-8"))
+                    for k in range(i + 1, len(line_starts)):
+                        line_starts[k] += length
+                    line_starts.insert(i + 1, pos + length)
+                    content_size += length
+
+                    content_lines.insert(i, line.payload)
+                    content_keys.insert(i, line.payload_key)
                     i += 1
                 elif content_lines[i].strip() == "":
                     i += 1
-                elif line.strip() == "":
+                elif line.blank:
                     # no j update
                     continue
                 else:
-                    print("\n".join(content_lines))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("\n".join(content_lines))
 
                     raise Exception(
-                        f"Could not apply hunk {hunk_index}: could not find {line[1:]}: expected {content_lines[i]}"
+                        f"Could not apply hunk {hunk_index}: could not find {line.text[1:]}: expected {content_lines[i]}"
                     )
 
         # check for errors
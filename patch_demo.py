@@ -20,17 +20,93 @@ Demo types:
 import os
 import sys
 import argparse
+import shutil
 import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Applies patches in process when libgit2 is available
+try:
+    import pygit2
+
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+# The worktrees are removed by cleanup(), so keep them in memory where
+# possible. The demo repository is left behind for manual exploration and
+# stays in the default temporary directory, where it does not hold RAM.
+WORKTREES_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def run_git_script(script, *args, env=None, input=None):
+    """Run a sequence of git commands in a single bash process
+
+    The script stops at the first failing command. Extra arguments are
+    available to the script as $1, $2, ... so they need no shell quoting,
+    env adds variables to the inherited environment and input is fed to
+    the script's stdin (for example a commit message read with -F -).
+    """
+    return subprocess.run(
+        ["bash", "-ec", script, "bash", *args],
+        input=input,
+        capture_output=True,
+        text=True,
+        env=None if env is None else {**os.environ, **env},
+    )
+
+
+# Contents of the files the demo writes, one directory per step. Each
+# <name>.tmpl is copied to <name>.
+TEMPLATES_DIR = Path(__file__).resolve().with_name("patch_demo_templates")
+
+# Sample project committed as the demo repository's initial state
+INITIAL_TEMPLATES = TEMPLATES_DIR / "initial"
+
+# Improvements committed as the enhanced-calculator patch
+ENHANCED_TEMPLATES = TEMPLATES_DIR / "enhanced"
+
+# Files added on the workflow branches, per worktree
+WORKFLOW_TEMPLATES = TEMPLATES_DIR / "workflow"
+
+
+def write_files(templates, directory="."):
+    """Copy every template in the templates directory into directory"""
+
+    def copy(template):
+        shutil.copyfile(template, Path(directory, template.stem))
+
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(copy, templates.glob("*.tmpl")))
+
 
 class PatchDemo:
-    """Demonstrates Logan's patch tools functionality"""
+    """Demonstrates Logan's patch tools functionality
+
+    The demo repository and its worktrees are throwaway: git is told not to
+    fsync anything written to them, and the worktrees live on tmpfs when
+    available.
+    """
 
     def __init__(self):
         self.original_dir = os.getcwd()
         self.test_repo = None
+        self._git_dir = None
+        self._main_sha = None
+        self.worktrees_dir = None
+        self.worktrees = []
+
+        # Skip fsync and optional lock files (such as the index refresh done
+        # by read-only commands) for every git command the demo runs. These
+        # are passed to each command instead of being set in os.environ.
+        config = os.environ.get("GIT_CONFIG_PARAMETERS")
+        self._demo_env = {
+            "GIT_CONFIG_PARAMETERS": (
+                f"{config} 'core.fsync=none'" if config else "'core.fsync=none'"
+            ),
+            "GIT_OPTIONAL_LOCKS": "0",
+        }
 
     def setup_demo_repo(self):
         """Create a demo repository with sample files"""
@@ -39,95 +115,57 @@ class PatchDemo:
         self.test_repo = tempfile.mkdtemp(prefix="logan_patch_demo_")
         os.chdir(self.test_repo)
 
-        # Initialize git repo
-        subprocess.run(["git", "init"], check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "demo@example.com"], check=True)
-        subprocess.run(["git", "config", "user.name", "Logan Demo"], check=True)
-
         # Create sample project files
         self.create_sample_files()
 
-        # Initial commit
-        subprocess.run(["git", "add", "."], check=True)
-        subprocess.run(["git", "commit", "-m", "Initial project setup"], check=True)
+        # Initialize git repo and make the initial commit
+        result = run_git_script(
+            """
+            git init -q -b main
+            # short lived repository: never pause for gc, refresh the index
+            # in parallel and skip optional background work
+            git config gc.auto 0
+            git config gc.autoPackLimit 0
+            git config core.preloadIndex true
+            git config core.fsmonitor false
+            git config fetch.writeCommitGraph false
+            git config user.email demo@example.com
+            git config user.name "Logan Demo"
+            git add .
+            git commit -q -m "Initial project setup"
+            git rev-parse --absolute-git-dir HEAD
+            """,
+            env=self._demo_env,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Could not set up demo repository: {result.stderr}")
+
+        # main does not move during the demo, so resolve it and the git
+        # directory once instead of letting every git command rediscover them
+        self._git_dir, self._main_sha = result.stdout.split()
 
         print(f"📁 Demo repository created at: {self.test_repo}")
 
+    @property
+    def _git_env(self):
+        """Environment pointing git at the demo repository directly"""
+        return {
+            **self._demo_env,
+            "GIT_DIR": self._git_dir,
+            "GIT_WORK_TREE": self.test_repo,
+        }
+
+    def _git(self, *args, **kwargs):
+        """Run a git command against the demo repository"""
+        kwargs.setdefault("env", {**os.environ, **self._demo_env})
+        return subprocess.run(
+            ["git", "--git-dir", self._git_dir, "--work-tree", self.test_repo, *args],
+            **kwargs,
+        )
+
     def create_sample_files(self):
         """Create sample files for demonstration"""
-
-        # Main application file
-        with open("app.py", "w") as f:
-            f.write("""#!/usr/bin/env python3
-\"\"\"
-Sample application for patch demonstration
-\"\"\"
-
-def calculate(operation, a, b):
-    if operation == "add":
-        return a + b
-    elif operation == "subtract":
-        return a - b
-    elif operation == "multiply":
-        return a * b
-    elif operation == "divide":
-        return a / b
-    else:
-        raise ValueError("Unsupported operation")
-
-def main():
-    print("Calculator App")
-    result = calculate("add", 10, 5)
-    print(f"10 + 5 = {result}")
-
-if __name__ == "__main__":
-    main()
-""")
-
-        # Utility functions
-        with open("utils.py", "w") as f:
-            f.write("""\"\"\"
-Utility functions for the sample application
-\"\"\"
-
-def validate_input(value):
-    if not isinstance(value, (int, float)):
-        return False
-    return True
-
-def format_result(result):
-    if isinstance(result, float):
-        return f"{result:.2f}"
-    return str(result)
-""")
-
-        # Configuration file
-        with open("config.py", "w") as f:
-            f.write("""# Configuration settings
-DEBUG = False
-VERSION = "1.0.0"
-SUPPORTED_OPERATIONS = ["add", "subtract", "multiply", "divide"]
-""")
-
-        # README file
-        with open("README.md", "w") as f:
-            f.write("""# Sample Calculator App
-
-A simple calculator application for demonstrating Logan's patch tools.
-
-## Features
-- Basic arithmetic operations
-- Input validation
-- Configurable settings
-
-## Usage
-```bash
-python3 app.py
-```
-
-## Version
-1.0.0
-""")
+        write_files(INITIAL_TEMPLATES)
 
     def demonstrate_patch_creation(self):
         """Demonstrate creating patches on separate branches"""
@@ -136,170 +174,7 @@ python3 app.py
         # Make some improvements to the code
         print("📝 Making improvements to demonstrate patch creation...")
 
-        # Improve the main app with better error handling
-        with open("app.py", "w") as f:
-            f.write("""#!/usr/bin/env python3
-\"\"\"
-Sample application for patch demonstration - Enhanced version
-\"\"\"
-import sys
-from utils import validate_input, format_result
-
-def calculate(operation, a, b):
-    # Enhanced with input validation
-    if not validate_input(a) or not validate_input(b):
-        raise TypeError("Arguments must be numbers")
-
-    if operation == "add":
-        return a + b
-    elif operation == "subtract":
-        return a - b
-    elif operation == "multiply":
-        return a * b
-    elif operation == "divide":
-        if b == 0:
-            raise ValueError("Cannot divide by zero")
-        return a / b
-    else:
-        raise ValueError(f"Unsupported operation: {operation}")
-
-def safe_calculate(operation, a, b):
-    \"\"\"Wrapper for safe calculation with error handling\"\"\"
-    try:
-        result = calculate(operation, a, b)
-        return format_result(result), None
-    except Exception as e:
-        return None, str(e)
-
-def main():
-    print("Enhanced Calculator App v1.1")
-
-    # Demonstrate various operations
-    operations = [
-        ("add", 10, 5),
-        ("subtract", 20, 8),
-        ("multiply", 7, 6),
-        ("divide", 15, 3)
-    ]
-
-    for op, a, b in operations:
-        result, error = safe_calculate(op, a, b)
-        if error:
-            print(f"{a} {op} {b} = Error: {error}")
-        else:
-            print(f"{a} {op} {b} = {result}")
-
-if __name__ == "__main__":
-    main()
-""")
-
-        # Add new utility functions
-        with open("utils.py", "w") as f:
-            f.write("""\"\"\"
-Enhanced utility functions for the sample application
-\"\"\"
-import re
-
-def validate_input(value):
-    \"\"\"Validate that input is a number\"\"\"
-    if not isinstance(value, (int, float)):
-        return False
-    # Check for NaN and infinity
-    if isinstance(value, float):
-        import math
-        if math.isnan(value) or math.isinf(value):
-            return False
-    return True
-
-def format_result(result):
-    \"\"\"Format numerical results for display\"\"\"
-    if isinstance(result, float):
-        if result.is_integer():
-            return str(int(result))
-        return f"{result:.6g}"  # Smart formatting
-    return str(result)
-
-def parse_expression(expression):
-    \"\"\"Parse a mathematical expression string\"\"\"
-    # Simple regex for basic operations
-    pattern = r'^(\d+(?:\.\d+)?)\s*([+\-*/])\s*(\d+(?:\.\d+)?)$'
-    match = re.match(pattern, expression.strip())
-
-    if not match:
-        raise ValueError("Invalid expression format")
-
-    a = float(match.group(1))
-    operation_map = {'+': 'add', '-': 'subtract', '*': 'multiply', '/': 'divide'}
-    operation = operation_map[match.group(2)]
-    b = float(match.group(3))
-
-    return operation, a, b
-
-def log_operation(operation, a, b, result):
-    \"\"\"Log calculation operations\"\"\"
-    with open("calculation.log", "a") as f:
-        f.write(f"{operation}({a}, {b}) = {result}\\n")
-""")
-
-        # Update configuration
-        with open("config.py", "w") as f:
-            f.write("""# Enhanced configuration settings
-DEBUG = False
-VERSION = "1.1.0"
-SUPPORTED_OPERATIONS = ["add", "subtract", "multiply", "divide"]
-
-# New configuration options
-LOG_CALCULATIONS = True
-MAX_PRECISION = 6
-ALLOW_INFINITY = False
-
-# Error messages
-ERROR_MESSAGES = {
-    "invalid_operation": "Operation not supported",
-    "type_error": "Invalid input type - numbers only",
-    "division_by_zero": "Cannot divide by zero",
-    "invalid_expression": "Invalid mathematical expression"
-}
-""")
-
-        # Add a new test file
-        with open("test_calculator.py", "w") as f:
-            f.write("""#!/usr/bin/env python3
-\"\"\"
-Test suite for the calculator application
-\"\"\"
-import unittest
-from app import calculate, safe_calculate
-from utils import validate_input, format_result, parse_expression
-
-class TestCalculator(unittest.TestCase):
-
-    def test_basic_operations(self):
-        self.assertEqual(calculate("add", 2, 3), 5)
-        self.assertEqual(calculate("subtract", 10, 4), 6)
-        self.assertEqual(calculate("multiply", 3, 7), 21)
-        self.assertEqual(calculate("divide", 15, 3), 5)
-
-    def test_input_validation(self):
-        self.assertTrue(validate_input(42))
-        self.assertTrue(validate_input(3.14))
-        self.assertFalse(validate_input("string"))
-        self.assertFalse(validate_input(None))
-
-    def test_error_handling(self):
-        result, error = safe_calculate("divide", 10, 0)
-        self.assertIsNone(result)
-        self.assertIn("zero", error.lower())
-
-    def test_expression_parsing(self):
-        op, a, b = parse_expression("10 + 5")
-        self.assertEqual(op, "add")
-        self.assertEqual(a, 10)
-        self.assertEqual(b, 5)
-
-if __name__ == "__main__":
-    unittest.main()
-""")
+        write_files(ENHANCED_TEMPLATES)
 
         print("✅ Enhanced application files created")
 
@@ -330,31 +205,31 @@ create_patch(
 )
         """)
 
-        # Actually create the patch using git commands directly
-        try:
-            # Add all modified files
-            subprocess.run(
-                ["git", "add", "app.py", "utils.py", "config.py", "test_calculator.py"],
-                check=True,
-                capture_output=True,
-            )
-
-            # Create new branch
-            result = subprocess.run(
-                ["git", "checkout", "-b", "feature/enhanced-calculator"],
-                capture_output=True,
-                text=True,
+        # Actually create the patch using git plumbing directly: write the
+        # modified files as blobs, build a tree from main's tree with them
+        # replaced and point the new branch at a commit of that tree. Neither
+        # the index nor the checked out branch is touched.
+        commit_result = run_git_script(
+            """
+            files="app.py utils.py config.py test_calculator.py"
+            tree=$(
+                {
+                    git ls-tree "$1" | awk -F '\t' -v files=" $files " \\
+                        'index(files, " " $2 " ") == 0'
+                    for file in $files; do
+                        printf '100644 blob %s\t%s\n' \\
+                            "$(git hash-object -w "$file")" "$file"
+                    done
+                } | git mktree
             )
-            if result.returncode != 0:
-                print(f"⚠️  Branch might already exist: {result.stderr}")
-
-            # Commit changes
-            commit_result = subprocess.run(
-                [
-                    "git",
-                    "commit",
-                    "-m",
-                    """Add input validation, error handling, and comprehensive testing
+            commit=$(git commit-tree "$tree" -p "$1")
+            git update-ref refs/heads/feature/enhanced-calculator "$commit"
+            echo "$commit"
+            """,
+            self._main_sha,
+            env=self._git_env,
+            # the commit message, read by commit-tree from stdin
+            input="""Add input validation, error handling, and comprehensive testing
 
 - Enhanced calculate() function with type validation
 - Added safe_calculate() wrapper for error handling
@@ -362,24 +237,14 @@ create_patch(
 - Added expression parsing capabilities
 - Comprehensive test suite with unit tests
 - Updated configuration with new options
-- Better error messages and logging support""",
-                ],
-                capture_output=True,
-                text=True,
-            )
+- Better error messages and logging support
+""",
+        )
 
-            if commit_result.returncode == 0:
-                # Get commit hash
-                hash_result = subprocess.run(
-                    ["git", "rev-parse", "HEAD"], capture_output=True, text=True
-                )
-                commit_hash = (
-                    hash_result.stdout.strip()[:8]
-                    if hash_result.returncode == 0
-                    else "unknown"
-                )
+        if commit_result.returncode == 0:
+            commit_hash = commit_result.stdout.strip()[:8] or "unknown"
 
-                print(f"""
+            print(f"""
 ✅ Patch Creation Result:
 
 🎉 Patch created successfully!
@@ -396,15 +261,9 @@ create_patch(
 
 🍒 To cherry-pick later: git cherry-pick {commit_hash}
 🔀 To merge: git merge feature/enhanced-calculator
-                """)
-            else:
-                print(f"❌ Commit failed: {commit_result.stderr}")
-
-            # Switch back to main
-            subprocess.run(["git", "checkout", "main"], capture_output=True)
-
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Git operation failed: {e}")
+            """)
+        else:
+            print(f"❌ Commit failed: {commit_result.stderr}")
 
     def demonstrate_patch_application(self):
         """Demonstrate applying patches to branches"""
@@ -454,67 +313,168 @@ apply_patch(
 
     def simulate_logan_patch_application(self, patch_content):
         """Simulate Logan's patch application"""
-        import tempfile
+        branch = "docs/update-readme-v11"
+        message = "Update README with v1.1 enhancements"
 
         try:
-            # Create temporary patch file
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".patch", delete=False
-            ) as f:
-                f.write(patch_content)
-                patch_file = f.name
-
-            # Create new branch
-            subprocess.run(
-                ["git", "checkout", "-b", "docs/update-readme-v11"], capture_output=True
-            )
-
-            # Apply patch
-            result = subprocess.run(
-                ["git", "apply", patch_file], capture_output=True, text=True
-            )
-
-            if result.returncode == 0:
-                # Check status
-                status_result = subprocess.run(
-                    ["git", "status", "--porcelain"], capture_output=True, text=True
+            # Apply the patch on top of main and commit the result on a new
+            # branch; the working tree and HEAD are left alone
+            if PYGIT2_AVAILABLE:
+                commit_id, error = self.apply_patch_in_process(
+                    patch_content, branch, message
+                )
+            else:
+                commit_id, error = self.apply_patch_with_git(
+                    patch_content, branch, message
                 )
 
+            if commit_id:
+                commit_hash = commit_id[:8]
+
                 print(f"""
 ✅ Patch Application Result:
 
 🎉 Patch applied successfully!
 🌿 Applied to branch: docs/update-readme-v11
+💾 Commit: {commit_hash}
 📂 Original branch: main
 
 📝 Modified files:
    M  README.md
 
 💡 Next steps:
-   1. Review changes with: git diff
-   2. Stage changes with: git add .
-   3. Commit changes with: git commit -m 'Update README with v1.1 enhancements'
+   1. Review changes with: git diff main..docs/update-readme-v11
+   2. Merge changes with: git merge docs/update-readme-v11
                 """)
 
-                # Show the actual changes
-                diff_result = subprocess.run(
-                    ["git", "diff", "README.md"], capture_output=True, text=True
+                # Show the actual changes, read from the object database and
+                # streamed by git straight to our stdout
+                print("\n📋 Applied changes:")
+                print("```diff", flush=True)
+                self._git(
+                    "--no-pager",
+                    "diff",
+                    "main..docs/update-readme-v11",
+                    "--",
+                    "README.md",
                 )
-                if diff_result.returncode == 0:
-                    print("\n📋 Applied changes:")
-                    print("```diff")
-                    print(diff_result.stdout)
-                    print("```")
+                print("```")
 
             else:
-                print(f"❌ Patch application failed: {result.stderr}")
-
-            # Cleanup
-            os.unlink(patch_file)
+                print(f"❌ Patch application failed: {error}")
 
         except Exception as e:
             print(f"❌ Error during patch application: {e}")
 
+    def apply_patch_in_process(self, patch_content, branch, message):
+        """Commit patch_content on top of main as branch, using libgit2
+
+        The patch is parsed and applied in process through the index, which is
+        reset to main afterwards. Returns (commit id, None) or (None, error).
+        """
+        repo = pygit2.Repository(self._git_dir)
+        base = repo[self._main_sha]
+
+        try:
+            repo.apply(
+                pygit2.Diff.parse_diff(patch_content),
+                pygit2.enums.ApplyLocation.INDEX,
+            )
+            tree = repo.index.write_tree()
+        except (pygit2.GitError, KeyError) as e:
+            # parse_diff raises KeyError when there is no patch in the input
+            return None, str(e)
+        finally:
+            repo.index.read_tree(base.tree)
+            repo.index.write()
+
+        signature = repo.default_signature
+        commit_id = repo.create_commit(
+            f"refs/heads/{branch}", signature, signature, message, tree, [base.id]
+        )
+        return str(commit_id), None
+
+    def apply_patch_with_git(self, patch_content, branch, message):
+        """Commit patch_content on top of main as branch, using git apply
+
+        The patch is applied to a copy of the index. Returns (commit id, None)
+        or (None, error).
+        """
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".patch") as f:
+            f.write(patch_content)
+            f.flush()
+
+            result = run_git_script(
+                """
+                index=$(mktemp)
+                trap 'rm -f "$index"' EXIT
+                cp "$(git rev-parse --git-path index)" "$index"
+                export GIT_INDEX_FILE="$index"
+                git apply --cached "$1"
+                tree=$(git write-tree)
+                commit=$(git commit-tree "$tree" -p "$2")
+                git update-ref "refs/heads/$3" "$commit"
+                echo "$commit"
+                """,
+                f.name,
+                self._main_sha,
+                branch,
+                env=self._git_env,
+                input=f"{message}\n",
+            )
+
+        if result.returncode != 0:
+            return None, result.stderr
+        return result.stdout.strip(), None
+
+    def prepare_worktrees_dir(self):
+        """Create the temporary directory holding the worktrees, once"""
+        if self.worktrees_dir is None:
+            self.worktrees_dir = tempfile.mkdtemp(
+                prefix="logan_patch_worktrees_", dir=WORKTREES_TMP_DIR
+            )
+
+    def add_worktree(self, name, branch):
+        """Create a branch from main, checked out in its own worktree
+
+        The main working directory keeps its branch, so nothing there is
+        rewritten when switching between the workflow branches.
+        """
+        self.prepare_worktrees_dir()
+        path = os.path.join(self.worktrees_dir, name)
+        result = run_git_script(
+            'git worktree add -q -b "$2" "$1" "$3"',
+            path,
+            branch,
+            self._main_sha,
+            env=self._git_env,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Could not create worktree for {branch}: {result.stderr}"
+            )
+
+        self.worktrees.append(path)
+        return path
+
+    def create_patch_branch(self, name, branch, message):
+        """Commit the workflow files for name on a new branch from main"""
+        path = self.add_worktree(name, branch)
+        write_files(WORKFLOW_TEMPLATES / name, path)
+
+        result = run_git_script(
+            """
+            cd "$1"
+            git add .
+            git commit -q -F -
+            """,
+            path,
+            env=self._demo_env,
+            input=message,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Could not commit to {branch}: {result.stderr}")
+
     def demonstrate_complete_workflow(self):
         """Demonstrate a complete patch management workflow"""
         print("\n🎯 === COMPLETE WORKFLOW DEMONSTRATION ===")
@@ -529,142 +489,28 @@ apply_patch(
 5. Applies hotfixes to production branches
         """)
 
-        # Step 1: Create security improvement patch
+        # Steps 1 and 2 both branch from main in their own worktree and do
+        # not depend on each other, so create them concurrently
         print("\n📋 Step 1: Create security patch")
-
-        # Add security improvements
-        with open("security.py", "w") as f:
-            f.write("""#!/usr/bin/env python3
-\"\"\"
-Security utilities for the calculator application
-\"\"\"
-import hashlib
-import hmac
-import secrets
-
-def hash_password(password, salt=None):
-    \"\"\"Hash password with salt\"\"\"
-    if salt is None:
-        salt = secrets.token_hex(32)
-
-    pwdhash = hashlib.pbkdf2_hmac('sha256',
-                                  password.encode('utf-8'),
-                                  salt.encode('utf-8'),
-                                  100000)
-    return pwdhash.hex(), salt
-
-def verify_password(password, hash_value, salt):
-    \"\"\"Verify password against hash\"\"\"
-    return hmac.compare_digest(
-        hash_password(password, salt)[0],
-        hash_value
-    )
-
-def sanitize_input(user_input):
-    \"\"\"Basic input sanitization\"\"\"
-    if not isinstance(user_input, str):
-        return str(user_input)
-
-    # Remove potentially dangerous characters
-    dangerous_chars = ['<', '>', '&', '"', "'", ';', '|', '`']
-    sanitized = user_input
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, '')
-
-    return sanitized.strip()
-
-def rate_limit_check(user_id, max_requests=10, window=60):
-    \"\"\"Simple rate limiting check\"\"\"
-    # In real implementation, this would use Redis or similar
-    # For demo, we'll just return True
-    return True
-""")
-
-        # Create the security patch
-        subprocess.run(["git", "add", "security.py"], capture_output=True)
-        subprocess.run(
-            ["git", "checkout", "-b", "security/add-utils"], capture_output=True
-        )
-        subprocess.run(
-            [
-                "git",
-                "commit",
-                "-m",
-                "Add security utilities for input sanitization and password handling",
-            ],
-            capture_output=True,
-        )
-
-        # Step 2: Create logging patch
         print("📋 Step 2: Create logging patch")
-        subprocess.run(["git", "checkout", "main"], capture_output=True)
-
-        with open("logging_config.py", "w") as f:
-            f.write("""#!/usr/bin/env python3
-\"\"\"
-Logging configuration for the calculator application
-\"\"\"
-import logging
-import logging.handlers
-from datetime import datetime
-
-def setup_logging(log_level=logging.INFO, log_file='app.log'):
-    \"\"\"Configure application logging\"\"\"
-
-    # Create logger
-    logger = logging.getLogger('calculator')
-    logger.setLevel(log_level)
-
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    # File handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=1024*1024, backupCount=5
-    )
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-
-    return logger
-
-def log_security_event(event_type, details, user_id=None):
-    \"\"\"Log security-related events\"\"\"
-    logger = logging.getLogger('calculator.security')
-    logger.warning(f"Security Event: {event_type} - {details} - User: {user_id}")
-
-def log_calculation(operation, inputs, result, user_id=None):
-    \"\"\"Log calculation operations\"\"\"
-    logger = logging.getLogger('calculator.operations')
-    logger.info(f"Calculation: {operation}({inputs}) = {result} - User: {user_id}")
-""")
-
-        subprocess.run(["git", "add", "logging_config.py"], capture_output=True)
-        subprocess.run(
-            ["git", "checkout", "-b", "feature/logging-system"], capture_output=True
-        )
-        subprocess.run(
-            [
-                "git",
-                "commit",
-                "-m",
-                "Add comprehensive logging system with rotation and security event logging",
-            ],
-            capture_output=True,
-        )
+        self.prepare_worktrees_dir()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(
+                executor.map(
+                    self.create_patch_branch,
+                    ["security", "logging"],
+                    ["security/add-utils", "feature/logging-system"],
+                    [
+                        "Add security utilities for input sanitization and password handling",
+                        "Add comprehensive logging system with rotation and security event logging",
+                    ],
+                )
+            )
 
         # Step 3: Show cherry-picking workflow
         print("📋 Step 3: Cherry-picking to release branch")
-        subprocess.run(["git", "checkout", "main"], capture_output=True)
-        subprocess.run(["git", "checkout", "-b", "release/v1.2"], capture_output=True)
+        self.add_worktree("release", "release/v1.2")
 
         print("""
 🍒 Cherry-picking workflow:
@@ -680,26 +526,18 @@ git cherry-pick <logging-commit-hash>
 # Result: Clean release branch with only desired features
         """)
 
-        # Switch back to main for cleanup
-        subprocess.run(["git", "checkout", "main"], capture_output=True)
-
         print("\n✅ Complete workflow demonstration finished!")
 
     def show_git_status(self):
         """Show final repository status"""
         print("\n📊 === FINAL REPOSITORY STATUS ===")
 
-        # Show branches
-        result = subprocess.run(["git", "branch", "-a"], capture_output=True, text=True)
-        print(f"🌿 Branches created:\n{result.stdout}")
+        # Show branches and recent commits; git writes to our stdout directly
+        print("🌿 Branches created:", flush=True)
+        self._git("--no-pager", "branch", "-a")
 
-        # Show recent commits
-        result = subprocess.run(
-            ["git", "log", "--oneline", "--all", "--graph", "-10"],
-            capture_output=True,
-            text=True,
-        )
-        print(f"📝 Recent commits:\n{result.stdout}")
+        print("\n📝 Recent commits:", flush=True)
+        self._git("--no-pager", "log", "--oneline", "--all", "--graph", "-10")
 
         print(f"\n🗂️  Demo repository location: {self.test_repo}")
         print(
@@ -707,7 +545,24 @@ git cherry-pick <logging-commit-hash>
         )
 
     def cleanup(self):
-        """Cleanup and return to original directory"""
+        """Cleanup worktrees and return to original directory"""
+        if self.worktrees:
+            run_git_script(
+                """
+                for worktree in "$@"; do
+                    git worktree remove --force "$worktree"
+                done
+                git worktree prune
+                """,
+                *self.worktrees,
+                env=self._git_env,
+            )
+            self.worktrees = []
+
+        if self.worktrees_dir is not None:
+            shutil.rmtree(self.worktrees_dir, ignore_errors=True)
+            self.worktrees_dir = None
+
         os.chdir(self.original_dir)
 
     def run_demo(self, demo_type="all"):
@@ -18,10 +18,42 @@ import signal
 import sys
 import json
 import re
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+# orjson serializes saved exceptions much faster; fall back to json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# uvloop runs the stream event loop with less overhead (POSIX only)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data to a compact JSON string"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
 # Raven brick configurations
 RAVEN_BRICKS = {
     "3KKPiWPJZ4xiJAl0ZA1vY": {
@@ -40,105 +72,208 @@ RAVEN_BRICKS = {
         "priority": "MEDIUM",
     },
 }
+# Shown for bricks that are not in RAVEN_BRICKS
+UNKNOWN_BRICK = {"name": "Unknown", "priority": "LOW"}
+
+# Separators used by the console output
+SEPARATOR = "=" * 80
+STACKTRACE_SEPARATOR = "─" * 60
+
+# Brick lines of the exception banner, formatted once per known brick
+BRICK_BANNERS = {
+    brick_id: f"🧱 Brick: {info['name']} ({brick_id})\n⭐ Priority: {info['priority']}"
+    for brick_id, info in RAVEN_BRICKS.items()
+}
+
+# Python exception types by detection pattern name, in matching order; the
+# most common runtime errors come first so the alternation tries them first
+PYTHON_EXCEPTION_TYPES = {
+    "attribute_error": ["AttributeError"],
+    "type_error": ["TypeError"],
+    "value_error": ["ValueError"],
+    "key_error": ["KeyError"],
+    "index_error": ["IndexError"],
+    "name_error": ["NameError"],
+    "import_error": ["ImportError", "ModuleNotFoundError"],
+    "runtime_error": ["RuntimeError", "RecursionError", "MemoryError"],
+    "syntax_error": ["SyntaxError"],
+    "indentation_error": ["IndentationError", "TabError"],
+    "general_exception": ["Exception"],
+}
+
+# Analysis printed per detection pattern; general_exception depends on the
+# message and is handled by PythonOnlyMonitor.analyze_general_exception
+PYTHON_EXCEPTION_ANALYSIS = {
+    "syntax_error": "\n".join(
+        [
+            "\n🔴 PYTHON SYNTAX ERROR ANALYSIS:",
+            "   ❌ Python code has syntax errors",
+            "   → Check for missing colons, parentheses, or quotes",
+            "   → Verify proper indentation",
+            "   → Review the file and line number in stacktrace",
+        ]
+    ),
+    "indentation_error": "\n".join(
+        [
+            "\n🔴 PYTHON INDENTATION ERROR ANALYSIS:",
+            "   ❌ Indentation is incorrect",
+            "   → Check for mixed tabs and spaces",
+            "   → Ensure consistent indentation levels",
+        ]
+    ),
+    "import_error": "\n".join(
+        [
+            "\n🟠 PYTHON IMPORT ERROR ANALYSIS:",
+            "   ❌ Module import failed",
+            "   → Check if module is installed",
+            "   → Verify module name spelling",
+            "   → Check Python path",
+        ]
+    ),
+    "attribute_error": "\n".join(
+        [
+            "\n🟠 PYTHON ATTRIBUTE ERROR ANALYSIS:",
+            "   ❌ Object attribute access failed",
+            "   → Check if object has the attribute",
+            "   → Verify object initialization",
+            "   → Check for typos in attribute name",
+        ]
+    ),
+    "type_error": "\n".join(
+        [
+            "\n🟠 PYTHON TYPE ERROR ANALYSIS:",
+            "   ❌ Type mismatch or incorrect usage",
+            "   → Check function arguments",
+            "   → Verify data types",
+            "   → Review method calls",
+        ]
+    ),
+    "value_error": "\n".join(
+        [
+            "\n🟠 PYTHON VALUE ERROR ANALYSIS:",
+            "   ❌ Invalid value passed",
+            "   → Validate input data",
+            "   → Check data ranges and formats",
+        ]
+    ),
+    "key_error": "\n".join(
+        [
+            "\n🟠 PYTHON KEY ERROR ANALYSIS:",
+            "   ❌ Dictionary key not found",
+            "   → Check if key exists before access",
+            "   → Use .get() method for safe access",
+            "   → Verify key spelling and type",
+        ]
+    ),
+    "index_error": "\n".join(
+        [
+            "\n🟠 PYTHON INDEX ERROR ANALYSIS:",
+            "   ❌ List index out of bounds",
+            "   → Check list length before access",
+            "   → Add bounds validation",
+        ]
+    ),
+    "name_error": "\n".join(
+        [
+            "\n🟠 PYTHON NAME ERROR ANALYSIS:",
+            "   ❌ Variable or function not defined",
+            "   → Check variable spelling",
+            "   → Verify variable is in scope",
+            "   → Check for import statements",
+        ]
+    ),
+}
+
+# Substrings of which at least one occurs in every Python-related log line,
+# checked on the raw bytes before a line is decoded
+PYTHON_LINE_MARKERS = re.compile(
+    rb'Traceback \(most recent call last\)|File "|\.py", line|Exception:|Error:'
+)
+
+# Exceptions waiting to be written to the output file, and per write
+LOG_QUEUE_SIZE = 10000
+LOG_WRITE_BATCH_SIZE = 100
+
+# Lines at least this long are scanned in a worker thread so that large
+# tracebacks do not hold up the other brick streams on the event loop
+THREADED_DETECTION_MIN_LENGTH = 512
 
 
 class PythonExceptionDetector:
     """Detects Python exceptions in log streams"""
 
-    def __init__(self):
-        # Python exception patterns only
-        self.python_patterns = {
-            "traceback_start": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+Traceback\s*\(most recent call last\):",
-                re.IGNORECASE,
-            ),
-            "python_file": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+File\s+\"(?P<filename>.*?\.py)\",\s+line\s+(?P<line_num>\d+)",
-                re.IGNORECASE,
-            ),
-            "syntax_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>SyntaxError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "indentation_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>IndentationError|TabError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "import_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>ImportError|ModuleNotFoundError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "attribute_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>AttributeError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "type_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>TypeError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "value_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>ValueError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "key_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>KeyError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "index_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>IndexError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "name_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>NameError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "runtime_error": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>RuntimeError|RecursionError|MemoryError):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-            "general_exception": re.compile(
-                r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>Exception):\s*(?P<message>.*?)$",
-                re.IGNORECASE,
-            ),
-        }
+    # Python exception patterns only, compiled once and shared by all detectors
+    python_patterns = {
+        "traceback_start": re.compile(
+            r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+Traceback\s*\(most recent call last\):",
+            re.ASCII,
+        ),
+        "python_file": re.compile(
+            r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+File\s+\"(?P<filename>.*?\.py)\",\s+line\s+(?P<line_num>\d+)",
+            re.ASCII,
+        ),
+    }
+
+    # All exception patterns share the app prefix, so they are matched by a
+    # single alternation; the pattern name is looked up from the type
+    exception_pattern_names = {
+        exception_type: pattern_name
+        for pattern_name, exception_types in PYTHON_EXCEPTION_TYPES.items()
+        for exception_type in exception_types
+    }
+    exception_pattern = re.compile(
+        r"(?P<app_name>\w+)<(?P<version>\d+)>\((?P<process>\d+)\)\s+(?P<exception_type>"
+        + "|".join(
+            exception_type
+            for exception_types in PYTHON_EXCEPTION_TYPES.values()
+            for exception_type in exception_types
+        )
+        + r"):\s*(?P<message>.*?)$",
+        re.ASCII,
+    )
 
+    # Shortest line the exception pattern can match, e.g. "a<1>(2) TabError:"
+    min_exception_line_length = len("a<1>(2) :") + min(
+        len(exception_type)
+        for exception_types in PYTHON_EXCEPTION_TYPES.values()
+        for exception_type in exception_types
+    )
+
+    def __init__(self):
         self.in_python_traceback = False
         self.current_stacktrace = []
         self.current_app_info = {}
 
     def is_python_related(self, log_line: str) -> bool:
         """Check if log line is Python-related"""
-        python_indicators = [
-            "Traceback (most recent call last)",
-            'File "',
-            '.py", line',
-            "Exception:",
-            "Error:",
-            "SyntaxError:",
-            "ImportError:",
-            "AttributeError:",
-            "TypeError:",
-            "ValueError:",
-            "KeyError:",
-            "IndexError:",
-            "NameError:",
-        ]
-
-        return any(indicator in log_line for indicator in python_indicators)
+        # The specific "...Error:" indicators are all covered by "Error:";
+        # these are the same markers PYTHON_LINE_MARKERS matches on raw bytes
+        return (
+            "Error:" in log_line
+            or "Exception:" in log_line
+            or 'File "' in log_line
+            or '.py", line' in log_line
+            or "Traceback (most recent call last)" in log_line
+        )
 
     def detect_python_exception(self, log_line: str) -> Optional[Dict[str, Any]]:
-        """Detect Python exception in log line"""
+        """Detect Python exception in log line
 
-        # Skip if not Python related
-        if not self.is_python_related(log_line):
-            return None
+        Only Python-related lines (see is_python_related) should be passed in;
+        the stream monitor filters them on the raw bytes.
+        """
+        # Every pattern needs the "app<version>(process)" prefix, so lines
+        # without its ">(" are only used to track traceback state
+        has_app_prefix = ">(" in log_line
 
         # Check for traceback start
         if "Traceback (most recent call last)" in log_line:
             self.in_python_traceback = True
             self.current_stacktrace = [log_line.strip()]
 
-            match = self.python_patterns["traceback_start"].search(log_line)
+            match = has_app_prefix and self.python_patterns["traceback_start"].search(
+                log_line
+            )
             if match:
                 self.current_app_info = {
                     "app_name": match.group("app_name"),
@@ -146,10 +281,13 @@ class PythonExceptionDetector:
                     "process": match.group("process"),
                 }
 
+            # Interim events share the live stacktrace list: the caller only
+            # acts on "python_exception" events, and the list is handed over
+            # (not copied) once the exception is captured and state is reset
             return {
                 "type": "traceback_start",
                 "app_info": self.current_app_info,
-                "stacktrace": self.current_stacktrace.copy(),
+                "stacktrace": self.current_stacktrace,
                 "log_line": log_line.strip(),
             }
 
@@ -158,59 +296,57 @@ class PythonExceptionDetector:
             self.current_stacktrace.append(log_line.strip())
 
             # Check for file reference
-            file_match = self.python_patterns["python_file"].search(log_line)
+            file_match = has_app_prefix and self.python_patterns["python_file"].search(
+                log_line
+            )
             if file_match:
                 return {
                     "type": "python_file",
                     "app_info": self.current_app_info,
-                    "stacktrace": self.current_stacktrace.copy(),
+                    "stacktrace": self.current_stacktrace,
                     "filename": file_match.group("filename"),
                     "line_number": file_match.group("line_num"),
                     "log_line": log_line.strip(),
                 }
 
         # Check for actual Python exceptions
-        for pattern_name, pattern in self.python_patterns.items():
-            if pattern_name in ["traceback_start", "python_file"]:
-                continue
+        if not has_app_prefix or len(log_line) < self.min_exception_line_length:
+            return None
 
-            match = pattern.search(log_line)
-            if match:
-                if self.in_python_traceback:
-                    self.current_stacktrace.append(log_line.strip())
-
-                exception_data = {
-                    "type": "python_exception",
-                    "pattern": pattern_name,
-                    "exception_type": match.group("exception_type"),
-                    "message": match.group("message"),
-                    "app_info": self.current_app_info
+        match = self.exception_pattern.search(log_line)
+        if match:
+            if self.in_python_traceback:
+                self.current_stacktrace.append(log_line.strip())
+
+            exception_data = {
+                "type": "python_exception",
+                "pattern": self.exception_pattern_names[match.group("exception_type")],
+                "exception_type": match.group("exception_type"),
+                "message": match.group("message"),
+                "app_info": (
+                    self.current_app_info
                     if self.in_python_traceback
                     else {
-                        "app_name": match.group("app_name")
-                        if "app_name" in match.groupdict()
-                        else "unknown",
-                        "version": match.group("version")
-                        if "version" in match.groupdict()
-                        else "unknown",
-                        "process": match.group("process")
-                        if "process" in match.groupdict()
-                        else "unknown",
-                    },
-                    "stacktrace": self.current_stacktrace.copy()
+                        "app_name": match.group("app_name"),
+                        "version": match.group("version"),
+                        "process": match.group("process"),
+                    }
+                ),
+                "stacktrace": (
+                    self.current_stacktrace
                     if self.in_python_traceback
-                    else [log_line.strip()],
-                    "log_line": log_line.strip(),
-                    "timestamp": datetime.now(),
-                }
+                    else [log_line.strip()]
+                ),
+                "log_line": log_line.strip(),
+            }
 
-                # Reset traceback state after capturing exception
-                if self.in_python_traceback:
-                    self.in_python_traceback = False
-                    self.current_stacktrace = []
-                    self.current_app_info = {}
+            # Reset traceback state after capturing exception
+            if self.in_python_traceback:
+                self.in_python_traceback = False
+                self.current_stacktrace = []
+                self.current_app_info = {}
 
-                return exception_data
+            return exception_data
 
         return None
 
@@ -221,246 +357,206 @@ class PythonOnlyMonitor:
     def __init__(self, brick_ids=None):
         self.brick_ids = brick_ids or list(RAVEN_BRICKS.keys())
         self.running = False
+        self._log_queue = None
+        self._log_writer = None
+        self._client = None
         self.stats = {
             "python_exceptions": 0,
-            "by_type": {},
-            "by_brick": {},
-            "by_app_version": {},
-            "by_app_name": {},
+            "by_type": Counter(),
+            "by_brick": Counter(),
+            "by_app_version": Counter(),
+            "by_app_name": Counter(),
             "start_time": None,
         }
 
-    async def monitor_brick_stream(self, brick_id: str):
-        """Monitor single brick stream for Python exceptions"""
-        import httpx
+    async def monitor_brick_stream(self, brick_id: str, client):
+        """Monitor single brick stream for Python exceptions
 
+        All bricks are streamed through the one client opened by
+        start_monitoring, so they share its connection pool.
+        """
         url = f"https://cases.apps.raven.dtact.com/_log?brick={brick_id}&streaming"
         detector = PythonExceptionDetector()
 
-        auth = httpx.BasicAuth("remco", "remco")
-        timeout = httpx.Timeout(60.0, read=None)
-
-        async with httpx.AsyncClient(auth=auth, timeout=timeout) as client:
-            try:
-                async with client.stream("GET", url) as response:
-                    if response.status_code != 200:
-                        print(
-                            f"❌ Failed to connect to brick {brick_id}: HTTP {response.status_code}"
-                        )
-                        return
-
-                    print(f"✅ Connected to brick {brick_id}")
-                    buffer = ""
-
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        if not self.running:
-                            break
-
-                        text_chunk = chunk.decode("utf-8", errors="replace")
-                        buffer += text_chunk
-
-                        while "\n" in buffer:
-                            line, buffer = buffer.split("\n", 1)
-                            if line.strip():
+        try:
+            async with client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    print(
+                        f"❌ Failed to connect to brick {brick_id}: HTTP {response.status_code}"
+                    )
+                    return
+
+                print(f"✅ Connected to brick {brick_id}")
+                buffer = bytearray()
+
+                async for chunk in response.aiter_bytes(chunk_size=8192):
+                    if not self.running:
+                        break
+
+                    buffer.extend(chunk)
+
+                    # walk the complete lines in place and drop them from
+                    # the buffer at once; only lines that can be
+                    # Python-related are copied out and decoded
+                    start = 0
+                    while (end := buffer.find(b"\n", start)) != -1:
+                        if PYTHON_LINE_MARKERS.search(buffer, start, end):
+                            line = buffer[start:end].decode("utf-8", errors="replace")
+                            # the detection is awaited before the next
+                            # line, so each detector is used by one
+                            # thread at a time
+                            if len(line) >= THREADED_DETECTION_MIN_LENGTH:
+                                exception_data = await asyncio.to_thread(
+                                    detector.detect_python_exception, line
+                                )
+                            else:
                                 exception_data = detector.detect_python_exception(line)
-                                if (
-                                    exception_data
-                                    and exception_data["type"] == "python_exception"
-                                ):
-                                    await self.handle_python_exception(
-                                        brick_id, exception_data
-                                    )
-
-            except Exception as e:
-                print(f"❌ Error monitoring brick {brick_id}: {e}")
+                            if (
+                                exception_data
+                                and exception_data["type"] == "python_exception"
+                            ):
+                                await self.handle_python_exception(
+                                    brick_id, exception_data
+                                )
+                        start = end + 1
+                    del buffer[:start]
+
+        except Exception as e:
+            print(f"❌ Error monitoring brick {brick_id}: {e}")
 
     async def handle_python_exception(
         self, brick_id: str, exception_data: Dict[str, Any]
     ):
         """Handle detected Python exception"""
+        timestamp = datetime.now()
         self.stats["python_exceptions"] += 1
 
-        # Update stats by type
-        exc_type = exception_data["exception_type"]
-        if exc_type not in self.stats["by_type"]:
-            self.stats["by_type"][exc_type] = 0
-        self.stats["by_type"][exc_type] += 1
-
-        # Update stats by brick
-        if brick_id not in self.stats["by_brick"]:
-            self.stats["by_brick"][brick_id] = 0
+        # Update stats by type, brick, app version and app name
+        app_info = exception_data["app_info"]
+        self.stats["by_type"][exception_data["exception_type"]] += 1
         self.stats["by_brick"][brick_id] += 1
-
-        # Update stats by app version
-        app_version = exception_data["app_info"].get("version", "unknown")
-        if app_version not in self.stats["by_app_version"]:
-            self.stats["by_app_version"][app_version] = 0
-        self.stats["by_app_version"][app_version] += 1
-
-        # Update stats by app name
-        app_name = exception_data["app_info"].get("app_name", "unknown")
-        if app_name not in self.stats["by_app_name"]:
-            self.stats["by_app_name"][app_name] = 0
-        self.stats["by_app_name"][app_name] += 1
+        self.stats["by_app_version"][app_info.get("version", "unknown")] += 1
+        self.stats["by_app_name"][app_info.get("app_name", "unknown")] += 1
 
         # Display exception
-        brick_info = RAVEN_BRICKS.get(brick_id, {"name": "Unknown", "priority": "LOW"})
-
-        print(f"\n{'=' * 80}")
-        print(f"🐍 PYTHON EXCEPTION #{self.stats['python_exceptions']}")
-        print(f"{'=' * 80}")
-        print(f"🧱 Brick: {brick_info['name']} ({brick_id})")
-        print(f"⭐ Priority: {brick_info['priority']}")
-        print(f"⏰ Time: {exception_data['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+        brick_banner = BRICK_BANNERS.get(brick_id)
+        if brick_banner is None:
+            brick_banner = (
+                f"🧱 Brick: {UNKNOWN_BRICK['name']} ({brick_id})\n"
+                f"⭐ Priority: {UNKNOWN_BRICK['priority']}"
+            )
 
         # App info with enhanced display
-        app_info = exception_data["app_info"]
         app_name = app_info.get("app_name", "unknown")
         version = app_info.get("version", "unknown")
         process = app_info.get("process", "unknown")
 
-        print(f"📱 Application: {app_name}")
-        print(f"📊 Version: {version}")
-        print(f"🏃 Process ID: {process}")
-        print(f"🔗 Full Process: {app_name}<{version}>({process})")
-
-        # Exception details
-        print(f"🔥 Exception Type: {exception_data['exception_type']}")
-        print(f"💬 Exception Message: {exception_data['message']}")
-        print(f"🎯 Detection Pattern: {exception_data['pattern']}")
-
-        # Enhanced version info display
-        print(f"\n📋 APPLICATION DETAILS:")
-        print(f"   🏷️  Name: {app_name}")
-        print(f"   🔢 Version: {version}")
-        print(f"   ⚙️  Process: {process}")
+        # The whole report is built up front and written at once
+        lines = [
+            f"\n{SEPARATOR}",
+            f"🐍 PYTHON EXCEPTION #{self.stats['python_exceptions']}",
+            SEPARATOR,
+            brick_banner,
+            f"⏰ Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"📱 Application: {app_name}",
+            f"📊 Version: {version}",
+            f"🏃 Process ID: {process}",
+            f"🔗 Full Process: {app_name}<{version}>({process})",
+            # Exception details
+            f"🔥 Exception Type: {exception_data['exception_type']}",
+            f"💬 Exception Message: {exception_data['message']}",
+            f"🎯 Detection Pattern: {exception_data['pattern']}",
+            # Enhanced version info display
+            f"\n📋 APPLICATION DETAILS:",
+            f"   🏷️  Name: {app_name}",
+            f"   🔢 Version: {version}",
+            f"   ⚙️  Process: {process}",
+        ]
 
         # Version-specific analysis if available
         if version != "unknown":
             try:
                 version_num = int(version)
                 if version_num < 1000:
-                    print(f"   ⚠️  Low version number - consider updating")
+                    lines.append(f"   ⚠️  Low version number - consider updating")
                 elif version_num > 2000:
-                    print(f"   ✅ Recent version detected")
+                    lines.append(f"   ✅ Recent version detected")
             except ValueError:
-                print(f"   ❓ Version format: {version}")
+                lines.append(f"   ❓ Version format: {version}")
 
         # Python-specific analysis
-        self.analyze_python_exception(exception_data)
+        analysis = self.analyze_python_exception(exception_data)
+        if analysis:
+            lines.append(analysis)
 
         # Show stacktrace
         if exception_data["stacktrace"] and len(exception_data["stacktrace"]) > 1:
-            print(
+            lines.append(
                 f"\n📋 PYTHON STACKTRACE ({len(exception_data['stacktrace'])} lines):"
             )
-            print(f"{'─' * 60}")
+            lines.append(STACKTRACE_SEPARATOR)
             for i, line in enumerate(exception_data["stacktrace"], 1):
                 if "Traceback" in line:
-                    print(f"📚 {i:2d}. {line}")
+                    lines.append(f"📚 {i:2d}. {line}")
                 elif 'File "' in line:
-                    print(f"📁 {i:2d}. {line}")
-                elif any(err in line for err in ["Exception:", "Error:"]):
-                    print(f"🔴 {i:2d}. {line}")
+                    lines.append(f"📁 {i:2d}. {line}")
+                elif "Exception:" in line or "Error:" in line:
+                    lines.append(f"🔴 {i:2d}. {line}")
                 else:
-                    print(f"   {i:2d}. {line}")
-            print(f"{'─' * 60}")
+                    lines.append(f"   {i:2d}. {line}")
+            lines.append(STACKTRACE_SEPARATOR)
 
-        print(f"{'=' * 80}")
+        lines.append(SEPARATOR)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         # Save to file if configured
         if hasattr(self, "output_file") and self.output_file:
-            await self.save_exception(exception_data, brick_id)
-
-    def analyze_python_exception(self, exception_data: Dict[str, Any]):
-        """Provide Python-specific analysis"""
-        exc_type = exception_data["exception_type"].lower()
-        message = exception_data["message"].lower()
-
-        if "syntaxerror" in exc_type:
-            print(f"\n🔴 PYTHON SYNTAX ERROR ANALYSIS:")
-            print(f"   ❌ Python code has syntax errors")
-            print(f"   → Check for missing colons, parentheses, or quotes")
-            print(f"   → Verify proper indentation")
-            print(f"   → Review the file and line number in stacktrace")
-
-        elif "indentationerror" in exc_type or "taberror" in exc_type:
-            print(f"\n🔴 PYTHON INDENTATION ERROR ANALYSIS:")
-            print(f"   ❌ Indentation is incorrect")
-            print(f"   → Check for mixed tabs and spaces")
-            print(f"   → Ensure consistent indentation levels")
-
-        elif "importerror" in exc_type or "modulenotfounderror" in exc_type:
-            print(f"\n🟠 PYTHON IMPORT ERROR ANALYSIS:")
-            print(f"   ❌ Module import failed")
-            print(f"   → Check if module is installed")
-            print(f"   → Verify module name spelling")
-            print(f"   → Check Python path")
-
-        elif "attributeerror" in exc_type:
-            print(f"\n🟠 PYTHON ATTRIBUTE ERROR ANALYSIS:")
-            print(f"   ❌ Object attribute access failed")
-            print(f"   → Check if object has the attribute")
-            print(f"   → Verify object initialization")
-            print(f"   → Check for typos in attribute name")
-
-        elif "typeerror" in exc_type:
-            print(f"\n🟠 PYTHON TYPE ERROR ANALYSIS:")
-            print(f"   ❌ Type mismatch or incorrect usage")
-            print(f"   → Check function arguments")
-            print(f"   → Verify data types")
-            print(f"   → Review method calls")
-
-        elif "valueerror" in exc_type:
-            print(f"\n🟠 PYTHON VALUE ERROR ANALYSIS:")
-            print(f"   ❌ Invalid value passed")
-            print(f"   → Validate input data")
-            print(f"   → Check data ranges and formats")
-
-        elif "keyerror" in exc_type:
-            print(f"\n🟠 PYTHON KEY ERROR ANALYSIS:")
-            print(f"   ❌ Dictionary key not found")
-            print(f"   → Check if key exists before access")
-            print(f"   → Use .get() method for safe access")
-            print(f"   → Verify key spelling and type")
-
-        elif "indexerror" in exc_type:
-            print(f"\n🟠 PYTHON INDEX ERROR ANALYSIS:")
-            print(f"   ❌ List index out of bounds")
-            print(f"   → Check list length before access")
-            print(f"   → Add bounds validation")
-
-        elif "nameerror" in exc_type:
-            print(f"\n🟠 PYTHON NAME ERROR ANALYSIS:")
-            print(f"   ❌ Variable or function not defined")
-            print(f"   → Check variable spelling")
-            print(f"   → Verify variable is in scope")
-            print(f"   → Check for import statements")
-
-        elif "exception" in exc_type:
-            print(f"\n🟡 PYTHON GENERAL EXCEPTION ANALYSIS:")
-
-            # Check for common patterns in message
-            if "jwt" in message:
-                print(f"   🔐 JWT Token Issue:")
-                print(f"   → Check JWT token validity")
-                print(f"   → Verify team_id in token")
-                print(f"   → Check token expiration")
-            elif "team_id" in message:
-                print(f"   🔐 Team ID Issue:")
-                print(f"   → Verify team_id parameter")
-                print(f"   → Check user permissions")
-            else:
-                print(f"   ❌ General Python exception occurred")
-
-    async def save_exception(self, exception_data: Dict[str, Any], brick_id: str):
+            await self.save_exception(exception_data, brick_id, timestamp)
+
+    def analyze_python_exception(self, exception_data: Dict[str, Any]) -> Optional[str]:
+        """Return Python-specific analysis for the exception, if any"""
+        pattern = exception_data["pattern"]
+
+        if pattern == "general_exception":
+            return self.analyze_general_exception(exception_data["message"].lower())
+
+        return PYTHON_EXCEPTION_ANALYSIS.get(pattern)
+
+    def analyze_general_exception(self, message: str) -> str:
+        """Return analysis of a plain Exception based on its message"""
+        # Check for common patterns in message
+        if "jwt" in message:
+            return (
+                f"\n🟡 PYTHON GENERAL EXCEPTION ANALYSIS:\n"
+                f"   🔐 JWT Token Issue:\n"
+                f"   → Check JWT token validity\n"
+                f"   → Verify team_id in token\n"
+                f"   → Check token expiration"
+            )
+        elif "team_id" in message:
+            return (
+                f"\n🟡 PYTHON GENERAL EXCEPTION ANALYSIS:\n"
+                f"   🔐 Team ID Issue:\n"
+                f"   → Verify team_id parameter\n"
+                f"   → Check user permissions"
+            )
+        else:
+            return (
+                f"\n🟡 PYTHON GENERAL EXCEPTION ANALYSIS:\n"
+                f"   ❌ General Python exception occurred"
+            )
+
+    async def save_exception(
+        self, exception_data: Dict[str, Any], brick_id: str, timestamp: datetime
+    ):
         """Save exception to file"""
         # Enhanced output data with extracted app info
         app_info = exception_data["app_info"]
         output_data = {
             "brick_id": brick_id,
-            "brick_name": RAVEN_BRICKS.get(brick_id, {}).get("name", "Unknown"),
-            "timestamp": exception_data["timestamp"].isoformat(),
+            "brick_name": RAVEN_BRICKS.get(brick_id, UNKNOWN_BRICK)["name"],
+            "timestamp": timestamp.isoformat(),
             "exception_type": exception_data["exception_type"],
             "message": exception_data["message"],
             "app_name": app_info.get("app_name", "unknown"),
@@ -472,9 +568,44 @@ class PythonOnlyMonitor:
             "pattern": exception_data["pattern"],
         }
 
-        # Append to file
-        with open(self.output_file, "a") as f:
-            f.write(json.dumps(output_data) + "\n")
+        # Queue for the background writer
+        await self._log_queue.put(dumps_json(output_data))
+
+    async def _drain_log_queue(self):
+        """Append queued exceptions to the output file until None is queued
+
+        Everything queued by the time a write starts goes out in one batch,
+        and the file is written from a worker thread so the streams are never
+        blocked on disk I/O.
+        """
+        f = await asyncio.to_thread(open, self.output_file, "a", encoding="utf-8")
+        try:
+            done = False
+            while not done:
+                batch = []
+                record = await self._log_queue.get()
+                while True:
+                    if record is None:
+                        done = True
+                        break
+                    batch.append(record)
+                    if len(batch) >= LOG_WRITE_BATCH_SIZE:
+                        break
+                    try:
+                        record = self._log_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+
+                if batch:
+                    await asyncio.to_thread(self._write_log_batch, f, batch)
+        finally:
+            await asyncio.to_thread(f.close)
+
+    @staticmethod
+    def _write_log_batch(f, batch: List[str]):
+        """Write a batch of JSON lines and flush them"""
+        f.write("\n".join(batch) + "\n")
+        f.flush()
 
     async def start_monitoring(self, save_to_file=False):
         """Start monitoring all bricks for Python exceptions"""
@@ -486,15 +617,16 @@ class PythonOnlyMonitor:
             self.output_file = f"python_exceptions_{timestamp}.jsonl"
             print(f"💾 Saving Python exceptions to: {self.output_file}")
 
+            self._log_queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+            self._log_writer = asyncio.create_task(self._drain_log_queue())
+
         print(f"🐍 PYTHON EXCEPTIONS ONLY MONITOR")
-        print(f"{'=' * 80}")
+        print(SEPARATOR)
         print(f"📅 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"🧱 Monitoring {len(self.brick_ids)} brick(s) for Python exceptions:")
 
         for i, brick_id in enumerate(self.brick_ids, 1):
-            brick_info = RAVEN_BRICKS.get(
-                brick_id, {"name": "Unknown", "priority": "LOW"}
-            )
+            brick_info = RAVEN_BRICKS.get(brick_id, UNKNOWN_BRICK)
             print(
                 f"   {i}. {brick_info['name']} ({brick_id}) - Priority: {brick_info['priority']}"
             )
@@ -502,12 +634,24 @@ class PythonOnlyMonitor:
         print(f"🔍 Focus: Python tracebacks, exceptions, and errors ONLY")
         print(f"🚫 Filtering out: Non-Python logs, HTTP errors, general logs")
         print(f"⌨️  Press Ctrl+C to stop monitoring")
-        print(f"{'=' * 80}")
+        print(SEPARATOR)
+
+        # One client for all bricks; over HTTP/2 the streams are multiplexed
+        # on a single connection to the log server
+        import httpx
+
+        self._client = httpx.AsyncClient(
+            auth=httpx.BasicAuth("remco", "remco"),
+            timeout=httpx.Timeout(60.0, read=None),
+            http2=HTTP2_AVAILABLE,
+        )
 
         # Start monitoring tasks for each brick
         tasks = []
         for brick_id in self.brick_ids:
-            task = asyncio.create_task(self.monitor_brick_stream(brick_id))
+            task = asyncio.create_task(
+                self.monitor_brick_stream(brick_id, self._client)
+            )
             tasks.append(task)
 
         try:
@@ -516,6 +660,16 @@ class PythonOnlyMonitor:
             print(f"\n🛑 Monitoring cancelled")
         finally:
             self.running = False
+
+            # Let the writer flush what is still queued
+            if self._log_writer:
+                await self._log_queue.put(None)
+                await self._log_writer
+                self._log_writer = None
+
+            await self._client.aclose()
+            self._client = None
+
             self.print_final_stats()
 
     def print_final_stats(self):
@@ -525,9 +679,9 @@ class PythonOnlyMonitor:
 
         duration = (datetime.now() - self.stats["start_time"]).total_seconds()
 
-        print(f"\n{'=' * 80}")
+        print(f"\n{SEPARATOR}")
         print(f"📊 PYTHON EXCEPTIONS MONITORING SUMMARY")
-        print(f"{'=' * 80}")
+        print(SEPARATOR)
         print(f"⏱️  Duration: {duration:.1f} seconds ({duration / 60:.1f} minutes)")
         print(f"🐍 Python Exceptions: {self.stats['python_exceptions']}")
 
@@ -537,38 +691,30 @@ class PythonOnlyMonitor:
 
         if self.stats["by_type"]:
             print(f"\n🏷️  Python Exceptions by Type:")
-            for exc_type, count in sorted(
-                self.stats["by_type"].items(), key=lambda x: x[1], reverse=True
-            ):
+            for exc_type, count in self.stats["by_type"].most_common():
                 print(f"   {exc_type}: {count}")
 
         if self.stats["by_brick"]:
             print(f"\n🧱 Python Exceptions by Brick:")
-            for brick_id, count in sorted(
-                self.stats["by_brick"].items(), key=lambda x: x[1], reverse=True
-            ):
-                brick_info = RAVEN_BRICKS.get(brick_id, {"name": "Unknown"})
+            for brick_id, count in self.stats["by_brick"].most_common():
+                brick_info = RAVEN_BRICKS.get(brick_id, UNKNOWN_BRICK)
                 print(f"   {brick_info['name']} ({brick_id}): {count}")
 
         if self.stats["by_app_version"]:
             print(f"\n📊 Python Exceptions by App Version:")
-            for version, count in sorted(
-                self.stats["by_app_version"].items(), key=lambda x: x[1], reverse=True
-            ):
+            for version, count in self.stats["by_app_version"].most_common():
                 print(f"   Version {version}: {count}")
 
         if self.stats["by_app_name"]:
             print(f"\n📱 Python Exceptions by App Name:")
-            for app_name, count in sorted(
-                self.stats["by_app_name"].items(), key=lambda x: x[1], reverse=True
-            ):
+            for app_name, count in self.stats["by_app_name"].most_common():
                 print(f"   {app_name}: {count}")
 
         if hasattr(self, "output_file") and Path(self.output_file).exists():
             file_size = Path(self.output_file).stat().st_size
             print(f"\n💾 Output File: {self.output_file} ({file_size:,} bytes)")
 
-        print(f"{'=' * 80}")
+        print(SEPARATOR)
 
     def stop_monitoring(self):
         """Stop monitoring"""
@@ -666,6 +812,9 @@ if __name__ == "__main__":
     print("Filters out all non-Python related logs and errors")
     print()
 
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
@@ -5,44 +5,67 @@ Test runner to verify function signature extraction from tree-sitter analysis.
 
 import sys
 import os
-from dulwich_memory_analyzer import InMemoryAnalyzer
+from itertools import islice
+from pathlib import Path
+from dulwich_memory_analyzer import InMemoryAnalyzer, VirtualFile
 
+SIGNATURE_TEST_FILE = "test_signature_extraction.py"
+REAL_TEST_FILE = "logan.py"
 
-def test_signature_extraction():
+
+def analyze_test_files(analyzer, test_files):
+    """Load the test files that exist and analyze them in one pass"""
+    analyzer.virtual_files.clear()
+    analyzer.functions.clear()
+    analyzer.classes.clear()
+
+    # One directory listing answers every existence check
+    with os.scandir(".") as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+
+    for test_file in test_files:
+        if test_file in present:
+            # The parser takes the raw bytes
+            analyzer.virtual_files[test_file] = VirtualFile(
+                path=test_file, content=Path(test_file).read_bytes()
+            )
+
+    analyzer._analyze_python_files()
+
+
+def file_functions(analyzer, file_path):
+    """Functions found in one of the analyzed files"""
+    return {
+        func_name: func_info
+        for func_name, func_info in analyzer.functions.items()
+        if func_info.file_path == file_path
+    }
+
+
+def test_signature_extraction(analyzer):
     """Test the signature extraction feature"""
     print("🧪 Testing Function Signature Extraction")
     print("=" * 50)
 
     # Test with the signature test file
-    test_file = "test_signature_extraction.py"
+    test_file = SIGNATURE_TEST_FILE
 
-    if not os.path.exists(test_file):
+    if test_file not in analyzer.virtual_files:
         print(f"❌ Test file {test_file} not found")
         return False
 
-    # Create analyzer and analyze the test file
-    analyzer = InMemoryAnalyzer()
-
-    # Read test file content
-    with open(test_file, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Add to virtual files
-    analyzer.virtual_files[test_file] = type(
-        "VirtualFile", (), {"content": content, "text_content": lambda: content}
-    )()
-
-    # Analyze the file
-    analyzer._analyze_python_files([test_file])
+    functions = file_functions(analyzer, test_file)
 
-    print(f"📊 Found {len(analyzer.functions)} functions")
+    print(f"📊 Found {len(functions)} functions")
     print("\n🔍 Function Signatures:")
     print("-" * 30)
 
     success_count = 0
     total_count = 0
 
-    for func_name, func_info in analyzer.functions.items():
+    # Collect the report and write it at once
+    lines = []
+    for func_name, func_info in functions.items():
         total_count += 1
         signature = func_info.signature or "❌ No signature extracted"
 
@@ -52,17 +75,20 @@ def test_signature_extraction():
         else:
             status = "❌"
 
-        print(f"{status} {func_name}")
-        print(
+        lines.append(f"{status} {func_name}")
+        lines.append(
             f"   📄 {func_info.file_path}:{func_info.line_start}-{func_info.line_end}"
         )
-        print(f"   🔧 {signature}")
+        lines.append(f"   🔧 {signature}")
 
         if func_info.is_method:
-            print(f"   🏗️  Method in class: {func_info.class_name}")
+            lines.append(f"   🏗️  Method in class: {func_info.class_name}")
         if func_info.is_async:
-            print(f"   ⚡ Async function")
-        print()
+            lines.append(f"   ⚡ Async function")
+        lines.append("")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("=" * 50)
     print(f"📈 Results: {success_count}/{total_count} functions have signatures")
@@ -74,8 +100,10 @@ def test_signature_extraction():
 
     test_patterns = ["async", "function_with", "method"]
 
-    for pattern in test_patterns:
-        results = analyzer.search_combined(pattern, "functions")
+    results_by_pattern = analyzer.search_functions_multi(test_patterns)
+
+    for pattern, results in results_by_pattern.items():
+        results = [result for result in results if result["file"] == test_file]
         print(f"\n🔎 Pattern: '{pattern}' -> {len(results)} matches")
 
         for result in results[:3]:  # Show first 3 matches
@@ -87,35 +115,31 @@ def test_signature_extraction():
     )  # Consider successful if >70% have signatures
 
 
-def test_with_real_file():
+def test_with_real_file(analyzer):
     """Test signature extraction with a real Python file"""
     print("\n🧪 Testing with Real File (logan.py)")
     print("=" * 50)
 
-    analyzer = InMemoryAnalyzer()
-
     # Test with logan.py
-    test_file = "logan.py"
-    if os.path.exists(test_file):
-        with open(test_file, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        analyzer.virtual_files[test_file] = type(
-            "VirtualFile", (), {"content": content, "text_content": lambda: content}
-        )()
-
-        analyzer._analyze_python_files([test_file])
-
-        print(f"📊 Found {len(analyzer.functions)} functions in logan.py")
-
-        # Show some examples with signatures
-        example_count = 0
-        for func_name, func_info in analyzer.functions.items():
-            if func_info.signature and example_count < 5:
-                example_count += 1
-                print(f"✅ {func_name}")
-                print(f"   🔧 {func_info.signature}")
-                print()
+    test_file = REAL_TEST_FILE
+    if test_file in analyzer.virtual_files:
+        functions = file_functions(analyzer, test_file)
+
+        print(f"📊 Found {len(functions)} functions in logan.py")
+
+        # Show some examples with signatures, stopping after the fifth
+        examples = islice(
+            (
+                (func_name, func_info)
+                for func_name, func_info in functions.items()
+                if func_info.signature
+            ),
+            5,
+        )
+        for func_name, func_info in examples:
+            print(f"✅ {func_name}")
+            print(f"   🔧 {func_info.signature}")
+            print()
 
         return True
     else:
@@ -126,8 +150,12 @@ def test_with_real_file():
 if __name__ == "__main__":
     print("🚀 Starting Function Signature Extraction Tests\n")
 
-    test1_result = test_signature_extraction()
-    test2_result = test_with_real_file()
+    # One analyzer and one analysis pass for both tests
+    analyzer = InMemoryAnalyzer()
+    analyze_test_files(analyzer, [SIGNATURE_TEST_FILE, REAL_TEST_FILE])
+
+    test1_result = test_signature_extraction(analyzer)
+    test2_result = test_with_real_file(analyzer)
 
     print("\n" + "=" * 60)
     print("🏁 Final Results:")
@@ -3,8 +3,12 @@ import polars as pl
 import pyarrow as pa
 import json
 import asyncio
+import sys
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from rivendel import Secrets
+from dateutil import tz
 from dateutil.parser import isoparse
 import re
 import html2text
@@ -15,55 +19,124 @@ from loguru import logger
 from azure.identity import ClientSecretCredential
 from msgraph.core import GraphClient, HTTPClientFactory
 
+# httpx on an aiohttp transport holds up much better under many concurrent
+# Graph requests than httpx's own connection pool
+try:
+    from httpx_aiohttp import AiohttpTransport
+
+    AIOHTTP_TRANSPORT_AVAILABLE = True
+except ImportError:
+    AIOHTTP_TRANSPORT_AVAILABLE = False
+
+# orjson decodes the large Graph response pages considerably faster
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Refresh the Graph access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 300
+
+# Graph accepts at most 20 requests in a single $batch call
+BATCH_SIZE = 20
+
+# Pause all requests for a moment once Graph reports fewer remaining requests
+THROTTLE_REMAINING_THRESHOLD = 10
+THROTTLE_PAUSE = 1.0
+
+
+class GraphAPIError(Exception):
+    """Error response from the Graph API"""
+
+    def __init__(self, status_code, message):
+        super().__init__(f"API error: {status_code} - {message}")
+        self.status_code = status_code
+
+
+def loads_json(content):
+    """Parse a JSON response body"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 async def chunks(it, n):
     """Yield successive n-sized chunks from async iterator or aiostream."""
     chunk = []
 
-    try:
-        # Handle aiostream Stream objects
-        if hasattr(it, "__aiter__"):
-            async for item in it:
-                chunk.append(item)
-
-                if len(chunk) >= n:
-                    yield chunk
-                    chunk = []
-        else:
-            # Handle regular async iterators
-            while True:
-                item = await anext(it)
-                chunk.append(item)
+    async for item in it:
+        chunk.append(item)
 
-                if len(chunk) >= n:
-                    yield chunk
-                    chunk = []
-
-    except StopAsyncIteration:
-        pass
+        if len(chunk) >= n:
+            yield chunk
+            chunk = []
 
     if chunk:
         yield chunk
 
 
 class GraphEnumClient:
-    def __init__(self, credentials):
+    def __init__(
+        self, credentials, max_connections=1000, max_keepalive_connections=100
+    ):
         self.credentials = credentials
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        # The aiohttp transport only speaks HTTP/1.1; httpx's own transport
+        # multiplexes the requests over HTTP/2 when h2 is installed
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(60.0),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            limits=limits,
+            http2=HTTP2_AVAILABLE and not AIOHTTP_TRANSPORT_AVAILABLE,
+            transport=(
+                AiohttpTransport(limits=limits) if AIOHTTP_TRANSPORT_AVAILABLE else None
+            ),
         )
         self._token = None
+        self._token_expiry = 0
+        self._token_refresh = None  # In-flight token refresh task
         self._throttle_remaining = None  # Track remaining requests
 
+        # Closed while throttled, so concurrent requests share one backoff
+        self._rate_gate = asyncio.Event()
+        self._rate_gate.set()
+        self._rate_deadline = 0.0
+        self._rate_gate_handle = None
+
+    async def _refresh_token(self):
+        """Fetch a new token from the credentials"""
+        token = await asyncio.get_event_loop().run_in_executor(
+            None, self.credentials.get_token, "https://graph.microsoft.com/.default"
+        )
+        self._token = token.token
+        self._token_expiry = token.expires_on
+
+    def _schedule_token_refresh(self):
+        """Start a token refresh, or join the one already in flight"""
+        if self._token_refresh is None or self._token_refresh.done():
+            self._token_refresh = asyncio.create_task(self._refresh_token())
+        return self._token_refresh
+
     async def _get_auth_headers(self):
         """Get authorization headers with valid token"""
-        if not self._token:
-            # Get token from credentials
-            token = await asyncio.get_event_loop().run_in_executor(
-                None, self.credentials.get_token, "https://graph.microsoft.com/.default"
-            )
-            self._token = token.token
+        now = time.time()
+        if not self._token or now >= self._token_expiry:
+            # No usable token, wait for a fresh one
+            await self._schedule_token_refresh()
+        elif now >= self._token_expiry - TOKEN_REFRESH_MARGIN:
+            # Token is about to expire, refresh it in the background
+            self._schedule_token_refresh()
 
         return {
             "Authorization": f"Bearer {self._token}",
@@ -82,6 +155,29 @@ class GraphEnumClient:
                 self._throttle_remaining = int(remaining)
             except (ValueError, TypeError):
                 pass
+            else:
+                if self._throttle_remaining < THROTTLE_REMAINING_THRESHOLD:
+                    self._throttle(THROTTLE_PAUSE)
+
+    def _throttle(self, delay):
+        """Hold back all requests of this client for delay seconds"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+
+        # Keep a longer backoff that is already in place
+        if deadline <= self._rate_deadline:
+            return
+
+        self._rate_deadline = deadline
+        self._rate_gate.clear()
+        if self._rate_gate_handle is not None:
+            self._rate_gate_handle.cancel()
+        self._rate_gate_handle = loop.call_at(deadline, self._rate_gate.set)
+
+    async def _send(self, method, url, **kwargs):
+        """Send a request once the client is not throttled"""
+        await self._rate_gate.wait()
+        return await self.client.request(method, url, **kwargs)
 
     async def close(self):
         """Close the HTTP client"""
@@ -93,14 +189,186 @@ class GraphEnumClient:
 
         count = 0
 
-        while url:
-            try:
-                headers = await self._get_auth_headers()
+        # Request for the next page, issued while the current page is consumed
+        prefetch = None
 
-                # Log the full URL with params for debugging
-                print(f"Graph API request: {url} with params: {params}")
+        try:
+            while url:
+                try:
+                    if prefetch is not None:
+                        task, prefetch = prefetch, None
+                        response = await task
+                    else:
+                        headers = await self._get_auth_headers()
+
+                        # Log the full URL with params for debugging
+                        logger.debug(
+                            "Graph API request: {} with params: {}", url, params
+                        )
+
+                        response = await self._send(
+                            "GET", url, headers=headers, params=params
+                        )
+
+                    # Update throttle info from response headers
+                    await self._update_throttle_info(response)
+
+                    if response.status_code == 429:  # Too Many Requests
+                        retry_after = response.headers.get("Retry-After", "30")
+                        delay = int(retry_after)
+
+                        logger.warning(
+                            "Rate limited. Waiting for {} seconds before retrying...",
+                            delay,
+                        )
+                        self._throttle(delay)
+                        continue
+
+                    # Unauthorized - token might be expired
+                    if response.status_code == 401:
+                        logger.info("Token expired, refreshing...")
+                        self._token = None  # Reset token to force refresh
+                        headers = await self._get_auth_headers()
+                        response = await self._send(
+                            "GET", url, headers=headers, params=params
+                        )
+
+                    if response.status_code != 200:
+                        try:
+                            error_data = loads_json(response.content)
+                            error_msg = error_data.get("error", {}).get(
+                                "message", "Unknown error"
+                            )
+                        except:
+                            error_msg = f"HTTP {response.status_code}"
+                        raise GraphAPIError(response.status_code, error_msg)
+
+                    data = loads_json(response.content)
+
+                    url = data.get("@odata.nextLink")
+                    logger.info("Graph API URL (nextLink): {}", url)
+
+                    params = None
+
+                    retry_count = 0  # Reset retry count on successful request
+
+                    # Fetch the next page in the background while this one is
+                    # being yielded, unless the limit is reached on this page
+                    page_size = len(data.get("value", []))
+                    if url and (limit is None or count + page_size < limit):
+                        logger.debug(
+                            "Graph API request: {} with params: {}", url, params
+                        )
+                        prefetch = asyncio.create_task(
+                            self._send("GET", url, headers=headers, params=params)
+                        )
+
+                    for v in data.get("value", []):
+                        yield v
+                        count += 1
+
+                        if limit is not None and count >= limit:
+                            return
+                except httpx.TimeoutException:
+                    retry_count += 1
+                    if retry_count > max_retries:
+                        logger.error("Max retries exceeded: Timeout")
+                        raise
+
+                    wait_time = 2**retry_count
+                    logger.warning(
+                        "Timeout accessing {}. Retrying in {} seconds...",
+                        url,
+                        wait_time,
+                    )
+                    await asyncio.sleep(wait_time)
+
+                except (httpx.TransportError, GraphAPIError) as e:
+                    # Client errors such as 404 fail the same way when retried
+                    if isinstance(e, GraphAPIError) and e.status_code < 500:
+                        raise
+
+                    retry_count += 1
+                    if retry_count > max_retries:
+                        logger.error("Max retries exceeded: {}", e)
+                        raise
+
+                    wait_time = 2**retry_count  # Exponential backoff
+                    logger.warning(
+                        "Error accessing {}: {}. Retrying in {} seconds...",
+                        url,
+                        e,
+                        wait_time,
+                    )
+                    await asyncio.sleep(wait_time)
+
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
+
+    async def get_from(self, data, limit=None):
+        """Yield the items of an already fetched page, followed by its next pages"""
+        count = 0
+
+        for v in data.get("value", []):
+            yield v
+            count += 1
+
+            if limit is not None and count >= limit:
+                return
+
+        url = data.get("@odata.nextLink")
+        if url:
+            async for v in self.get(
+                url, None, limit=None if limit is None else limit - count
+            ):
+                yield v
 
-                response = await self.client.get(url, headers=headers, params=params)
+    async def batch(self, requests):
+        """Fetch several GET requests through the $batch endpoint
+
+        Args:
+            requests: List of (url, params) tuples
+
+        Returns:
+            The response bodies, in the order of the requests
+        """
+        groups = [
+            requests[i : i + BATCH_SIZE] for i in range(0, len(requests), BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._batch(group) for group in groups))
+        return [body for result in results for body in result]
+
+    async def _batch(self, requests):
+        """Send up to BATCH_SIZE GET requests in a single $batch call"""
+        retry_count = 0
+        max_retries = 5
+
+        # Subrequest urls are relative to the version, e.g. /users/{id}/messages
+        pending = {}
+        for i, (url, params) in enumerate(requests):
+            url = httpx.URL(url, params=params)
+            version = url.path.split("/")[1]
+            pending[str(i)] = url.raw_path.decode("ascii")[len(version) + 1 :]
+
+        batch_url = url.copy_with(raw_path=f"/{version}/$batch".encode("ascii"))
+        bodies = [None] * len(requests)
+
+        while pending:
+            headers = await self._get_auth_headers()
+            payload = {
+                "requests": [
+                    {"id": request_id, "method": "GET", "url": url}
+                    for request_id, url in pending.items()
+                ]
+            }
+
+            logger.debug("Graph API batch request: {} requests", len(pending))
+
+            try:
+                response = await self._send(
+                    "POST", batch_url, headers=headers, json=payload
+                )
 
                 # Update throttle info from response headers
                 await self._update_throttle_info(response)
@@ -109,100 +377,157 @@ class GraphEnumClient:
                     retry_after = response.headers.get("Retry-After", "30")
                     delay = int(retry_after)
 
-                    print(
-                        f"Rate limited. Waiting for {delay} seconds before retrying..."
+                    logger.warning(
+                        "Rate limited. Waiting for {} seconds before retrying...",
+                        delay,
                     )
-                    await asyncio.sleep(delay)
+                    self._throttle(delay)
                     continue
 
-                if response.status_code == 401:  # Unauthorized - token might be expired
-                    print("Token expired, refreshing...")
+                # Unauthorized - token might be expired
+                if response.status_code == 401:
+                    logger.info("Token expired, refreshing...")
                     self._token = None  # Reset token to force refresh
                     headers = await self._get_auth_headers()
-                    response = await self.client.get(
-                        url, headers=headers, params=params
+                    response = await self._send(
+                        "POST", batch_url, headers=headers, json=payload
                     )
 
                 if response.status_code != 200:
                     try:
-                        error_data = response.json()
+                        error_data = loads_json(response.content)
                         error_msg = error_data.get("error", {}).get(
                             "message", "Unknown error"
                         )
                     except:
                         error_msg = f"HTTP {response.status_code}"
-                    raise Exception(f"API error: {response.status_code} - {error_msg}")
-
-                data = response.json()
-
-                for v in data.get("value", []):
-                    yield v
-                    count += 1
-
-                    if limit is not None and count >= limit:
-                        return
-
-                url = data.get("@odata.nextLink")
-                logger.info(f"Graph API URL (nextLink): {url}")
-
-                params = None
+                    raise GraphAPIError(response.status_code, error_msg)
+            except (httpx.TransportError, GraphAPIError) as e:
+                # Client errors such as 404 fail the same way when retried
+                if isinstance(e, GraphAPIError) and e.status_code < 500:
+                    raise
 
-                retry_count = 0  # Reset retry count on successful request
-            except httpx.TimeoutException:
                 retry_count += 1
                 if retry_count > max_retries:
-                    logger.error(f"Max retries exceeded: Timeout")
+                    logger.error("Max retries exceeded: {}", e)
                     raise
 
-                wait_time = 2**retry_count
+                wait_time = 2**retry_count  # Exponential backoff
                 logger.warning(
-                    f"Timeout accessing {url}. Retrying in {wait_time} seconds..."
+                    "Error accessing {}: {}. Retrying in {} seconds...",
+                    batch_url,
+                    e,
+                    wait_time,
                 )
                 await asyncio.sleep(wait_time)
+                continue
+
+            # Throttled subrequests are sent again in the next batch
+            delay = 0
+            for sub in loads_json(response.content).get("responses", []):
+                status = sub.get("status")
+                body = sub.get("body") or {}
+
+                if status == 429:
+                    retry_after = sub.get("headers", {}).get("Retry-After", "30")
+                    delay = max(delay, int(retry_after))
+                    continue
 
-            except Exception as e:
-                raise
+                if status != 200:
+                    error_msg = body.get("error", {}).get("message", "Unknown error")
+                    raise GraphAPIError(status, error_msg)
 
+                bodies[int(sub["id"])] = body
+                pending.pop(sub["id"], None)
+
+            if pending:
                 retry_count += 1
                 if retry_count > max_retries:
-                    logger.error(f"Max retries exceeded: {e}")
-                    raise
+                    logger.error("Max retries exceeded: {} requests", len(pending))
+                    raise GraphAPIError(429, f"{len(pending)} batch requests failed")
 
-                wait_time = 2**retry_count  # Exponential backoff
                 logger.warning(
-                    f"Error accessing {url}: {e}. Retrying in {wait_time} seconds..."
+                    "Rate limited. Waiting for {} seconds before retrying...", delay
                 )
-                await asyncio.sleep(wait_time)
+                self._throttle(delay)
+
+        return bodies
+
+
+# Graph timestamps, e.g. 2024-01-02T03:04:05Z or 2024-01-02T03:04:05.1234567+01:00
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?",
+    re.ASCII,
+)
+
+# Placeholder dates Graph uses for "no date"
+_NULL_DATES = frozenset({"0001-01-01T00:00:00Z", "9999-12-31T23:59:59Z"})
 
 
 def parse_date(v):
     if v is None:
         return None
-    if v == "0001-01-01T00:00:00Z":
-        return None
-    if v == "9999-12-31T23:59:59Z":
+    if not isinstance(v, str):
+        return isoparse(v)
+    if v in _NULL_DATES:
         return None
 
-    dt = isoparse(v)
-    return dt
+    # Build the common Graph format directly, anything else goes to isoparse
+    m = _ISO_RE.fullmatch(v)
+    if m is None:
+        return isoparse(v)
 
+    year, month, day, hour, minute, second, fraction, offset = m.groups()
 
-def try_convert_value(value):
-    """Try to convert a value to an appropriate type.
-
-    Args:
-        value: The value to convert
-
-    Returns:
-        The converted value, or the original value if no conversion is possible
-    """
-    if value is None:
-        return None
+    if offset is None:
+        tzinfo = None
+    elif offset == "Z":
+        tzinfo = tz.UTC
+    else:
+        hours = int(offset[1:3])
+        minutes = int(offset[-2:])
+        if hours == 0 and minutes == 0:
+            tzinfo = tz.UTC
+        elif hours > 23 or minutes > 59:
+            return isoparse(v)
+        else:
+            sign = -1 if offset[0] == "-" else 1
+            tzinfo = tz.tzoffset(None, sign * (hours * 60 + minutes) * 60)
 
-    # If it's already a non-string type, return it as is
-    if not isinstance(value, str):
-        return value
+    # Fractions are truncated to microseconds, like isoparse does
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
 
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            microsecond,
+            tzinfo,
+        )
+    except ValueError:
+        # Out of range fields, or 24:00:00 which isoparse rolls over
+        return isoparse(v)
+
+
+# Strings (lower-cased) that convert to booleans
+_BOOL_MAP = {
+    "true": True,
+    "false": False,
+    "yes": True,
+    "no": False,
+    "y": True,
+    "n": False,
+    "1": True,
+    "0": False,
+}
+
+
+def _convert_string(value):
+    """Convert a string to an appropriate type, see try_convert_value."""
     # Trim whitespace
     value = value.strip()
 
@@ -210,39 +535,71 @@ def try_convert_value(value):
     if value == "":
         return value
 
-    # Try to convert to datetime
-    try:
-        return parse_date(value)
-    except (ValueError, TypeError):
-        pass
+    # Only attempt the conversions the first character allows, so most
+    # plain strings skip the failing parses altogether
+    c = value[0]
+
+    # Try to convert to datetime (dates always start with the year)
+    if len(value) >= 4 and c in "+0123456789":
+        try:
+            return parse_date(value)
+        except (ValueError, TypeError):
+            pass
 
     # Try to convert to number
-    try:
-        # First try integer
-        return int(value)
-    except (ValueError, TypeError):
-        pass
+    if c.isdigit() or c in "+-":
+        try:
+            # First try integer
+            return int(value)
+        except (ValueError, TypeError):
+            pass
 
-    try:
-        # Then try float
-        return float(value)
-    except (ValueError, TypeError):
-        pass
+    if c.isdigit() or c in "+-.iInN":
+        try:
+            # Then try float (this includes inf and nan)
+            return float(value)
+        except (ValueError, TypeError):
+            pass
 
     # Try to convert to boolean
-    if value.lower() in ["true", "false"]:
-        return value.lower() == "true"
-    elif value.lower() in ["yes", "no"]:
-        return value.lower() == "yes"
-    elif value.lower() in ["y", "n"]:
-        return value.lower() == "y"
-    elif value.lower() in ["1", "0"]:
-        return value == "1"
+    converted = _BOOL_MAP.get(value.lower())
+    if converted is not None:
+        return converted
 
     # Return the original value if no conversion is possible
     return value
 
 
+# Conversions of short strings are cached, as dates, numbers, flags and enum
+# values repeat a lot across records
+CONVERT_CACHE_MAX_LENGTH = 64
+CONVERT_CACHE_SIZE = 65536
+
+_convert_cached = lru_cache(maxsize=CONVERT_CACHE_SIZE)(_convert_string)
+
+
+def try_convert_value(value):
+    """Try to convert a value to an appropriate type.
+
+    Args:
+        value: The value to convert
+
+    Returns:
+        The converted value, or the original value if no conversion is possible
+    """
+    if value is None:
+        return None
+
+    # If it's already a non-string type, return it as is
+    if not isinstance(value, str):
+        return value
+
+    if len(value) <= CONVERT_CACHE_MAX_LENGTH:
+        return _convert_cached(value)
+
+    return _convert_string(value)
+
+
 def process_item_recursively(item):
     """Process an item recursively, converting values to appropriate types.
 
@@ -256,24 +613,82 @@ def process_item_recursively(item):
     if item is None:
         return None
 
+    # Local lookups, these are called for every key and leaf value
+    convert = try_convert_value
+    intern = sys.intern
+
     if isinstance(item, dict):
         result = {}
-        for key, value in item.items():
-            # Skip @odata type fields
-            if key == "@odata.type" or key.endswith("@odata.context"):
-                result[key] = value
-                continue
-
-            if isinstance(value, (dict, list)):
-                result[key] = process_item_recursively(value)
-            else:
-                result[key] = try_convert_value(value)
-
-        return result
     elif isinstance(item, list):
-        return [process_item_recursively(i) for i in item]
+        result = []
     else:
-        return try_convert_value(item)
+        return convert(item)
+
+    # Walk the nested dicts and lists with an explicit stack of (source, target)
+    # pairs; containers are added to their parent before being filled, so the
+    # key order of the source is kept
+    stack = [(item, result)]
+    while stack:
+        source, target = stack.pop()
+
+        if isinstance(source, dict):
+            for key, value in source.items():
+                # Records repeat the same keys, share a single string for each
+                key = intern(key)
+
+                # Skip @odata type fields
+                if key == "@odata.type" or key.endswith("@odata.context"):
+                    target[key] = value
+                elif isinstance(value, dict):
+                    target[key] = child = {}
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    target[key] = child = []
+                    stack.append((value, child))
+                else:
+                    target[key] = convert(value)
+        else:
+            for value in source:
+                if isinstance(value, dict):
+                    child = {}
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    child = []
+                    stack.append((value, child))
+                else:
+                    child = convert(value)
+                target.append(child)
+
+    return result
+
+
+# OData operators for the SQL comparison operators
+ODATA_OPERATORS = {"=": "eq", "!=": "ne", ">": "gt", ">=": "ge", "<": "lt", "<=": "le"}
+
+# Handler positions per expression type, see find_expression_handler
+_ODATA_HANDLER_CACHE = {}
+_SEARCH_HANDLER_CACHE = {}
+
+
+def find_expression_handler(handlers, cache, expr_type):
+    """Find the handler for an expression type.
+
+    Args:
+        handlers: List of (class, handler) tuples in order of precedence
+        cache: Dict caching the matching position per expression type
+        expr_type: The type of the expression
+
+    Returns:
+        The handler of the first class expr_type is a subclass of, or None
+    """
+    if expr_type not in cache:
+        cache[expr_type] = next(
+            (i for i, (cls, _) in enumerate(handlers) if issubclass(expr_type, cls)),
+            None,
+        )
+
+    index = cache[expr_type]
+    return None if index is None else handlers[index][1]
 
 
 class AzureGraphSchemaProvider:
@@ -299,12 +714,29 @@ class AzureGraphSchemaProvider:
         if self.secret is None:
             raise Exception("Secret not found")
 
+        # One credential and Graph client for all tables, so they share the
+        # connection pool and the access token
+        credential = ClientSecretCredential(
+            self.secret.get("AZURE_TENANT_ID"),
+            self.secret.get("AZURE_CLIENT_ID"),
+            self.secret.get("AZURE_CLIENT_SECRET"),
+        )
+        self.client = GraphEnumClient(
+            credential,
+            max_connections=self.params.get("max_connections", 1000),
+            max_keepalive_connections=self.params.get("max_keepalive_connections", 100),
+        )
+
         logger.info("Done configuring Azure Graph Schema provider", self.params)
 
     def tables(self):
         # Return all available table names
         return list(self.params.get("tables", {}).keys())
 
+    async def close(self):
+        """Close the shared Graph client"""
+        await self.client.close()
+
     def table(self, name):
         # Return a table provider for the requested table
         if (table := self._tables.get(name)) is not None:
@@ -318,10 +750,12 @@ class AzureGraphSchemaProvider:
         class_name = table_config.get("class_name")
 
         if name == "emails":
-            self._tables[name] = EmailTableProvider(name, self.secret, table_config)
+            self._tables[name] = EmailTableProvider(
+                name, self.secret, table_config, client=self.client
+            )
         else:
             self._tables[name] = AzureGraphTableProvider(
-                name, self.secret, table_config
+                name, self.secret, table_config, client=self.client
             )
 
         return self._tables.get(name)
@@ -355,7 +789,7 @@ class BaseAzureTableProvider:
 
 
 class AzureGraphTableProvider(BaseAzureTableProvider):
-    def __init__(self, name, secret, config):
+    def __init__(self, name, secret, config, client=None):
         super().__init__(name, secret, config)
 
         self._top = config.get("top")
@@ -364,13 +798,22 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
         # Type conversion settings
         self._type_conversion = config.get("type_conversion", {})
 
-        # Initialize Graph API client
-        CLIENT_ID = secret.get("AZURE_CLIENT_ID")
-        CLIENT_SECRET = secret.get("AZURE_CLIENT_SECRET")
-        TENANT_ID = secret.get("AZURE_TENANT_ID")
+        # Initialize Graph API client, unless a shared one is passed in
+        if client is None:
+            CLIENT_ID = secret.get("AZURE_CLIENT_ID")
+            CLIENT_SECRET = secret.get("AZURE_CLIENT_SECRET")
+            TENANT_ID = secret.get("AZURE_TENANT_ID")
+
+            credentials = ClientSecretCredential(TENANT_ID, CLIENT_ID, CLIENT_SECRET)
+            client = GraphEnumClient(
+                credentials,
+                max_connections=config.get("max_connections", 1000),
+                max_keepalive_connections=config.get("max_keepalive_connections", 100),
+            )
+        self.client = client
 
-        credentials = ClientSecretCredential(TENANT_ID, CLIENT_ID, CLIENT_SECRET)
-        self.client = GraphEnumClient(credentials)
+        # Limit concurrent mailbox enumeration to avoid exhausting connections
+        self._sem = asyncio.Semaphore(config.get("concurrency", 16))
 
     async def schema(self):
         mailbox = self._config.get("mailboxes")[0]
@@ -386,7 +829,7 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                     data.append(item)
 
         except Exception as e:
-            logger.error(f"Error fetching schema sample: {e}")
+            logger.error("Error fetching schema sample: {}", e)
             return pa.schema([])
 
         rb = pa.RecordBatch.from_pylist(data)
@@ -445,7 +888,7 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
 
         def validate_graph_field_path(field_path):
             """Validate and fix field paths for Graph API compatibility"""
-            print(f"DEBUG: validate_graph_field_path input: '{field_path}'")
+            logger.debug("validate_graph_field_path input: '{}'", field_path)
 
             # Get supported field paths from config
             supported_nested_fields = table_config.get("supported_nested_fields", [])
@@ -453,8 +896,9 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
 
             # Check if this is a configured supported nested field
             if field_path in supported_nested_fields:
-                print(
-                    f"DEBUG: validate_graph_field_path returning configured nested field: '{field_path}'"
+                logger.debug(
+                    "validate_graph_field_path returning configured nested field: '{}'",
+                    field_path,
                 )
                 return field_path
 
@@ -463,12 +907,12 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                 "[" in field_path
                 or any(field_path.startswith(af) for af in array_fields)
             ):
-                print(
-                    f"DEBUG: validate_graph_field_path keeping array path: '{field_path}'"
+                logger.debug(
+                    "validate_graph_field_path keeping array path: '{}'", field_path
                 )
                 return field_path
 
-            print(f"DEBUG: validate_graph_field_path returning: '{field_path}'")
+            logger.debug("validate_graph_field_path returning: '{}'", field_path)
             return field_path
 
         def extract_datafusion_value(obj):
@@ -485,13 +929,13 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
 
         def to_odata_filter(expr):
             """Convert datafusion/rivendel expression to OData filter syntax"""
-            print(f"DEBUG: Processing expression: {expr} (type: {type(expr)})")
+            logger.debug("Processing expression: {} (type: {})", expr, type(expr))
 
             # Check if this is a datafusion class
             type_name = str(type(expr))
             if "datafusion" in type_name:
                 class_name = expr.__class__.__name__
-                print(f"DEBUG: Datafusion class: {class_name}")
+                logger.debug("Datafusion class: {}", class_name)
 
                 if class_name == "Like":
                     return handle_like_expression(expr)
@@ -504,162 +948,201 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                     column_name = expr.name
                     return COLUMN_MAPPING.get(column_name, column_name)
                 else:
-                    print(f"DEBUG: Unhandled expression type: {type(expr)}")
+                    logger.debug("Unhandled expression type: {}", type(expr))
                     # Fall through to remaining handling
 
-            if isinstance(expr, rivendel.Alias):
-                return to_odata_filter(expr.expr)
-            elif isinstance(expr, rivendel.Column):
-                # Map column name to Graph API field
-                column_name = expr.name
-                return COLUMN_MAPPING.get(column_name, column_name)
-            elif isinstance(expr, rivendel.IndexedField):
-                # Handle nested field access recursively like from['emailAddress']['address']
-                print(f"DEBUG: IndexedField - expr: {expr.expr}, key: {expr.key}")
-
-                # Recursively process the base expression
-                base_field = to_odata_filter(expr.expr)
-                key = expr.key
-
-                # Handle Literal key (quoted strings)
-                if isinstance(key, rivendel.Literal):
-                    key = key.value
-                    print(f"DEBUG: Key was Literal, extracted value: {key}")
-
-                # Remove quotes from key if present
-                if isinstance(key, str) and key.startswith("'") and key.endswith("'"):
-                    key = key[1:-1]
-                    print(f"DEBUG: Removed quotes from key: {key}")
-
-                # Build path recursively - no hardcoded special cases needed
-                result = f"{base_field}/{key}"
-                print(f"DEBUG: IndexedField result: {result}")
-                return result
-            elif isinstance(expr, rivendel.Cast):
-                return to_odata_filter(expr.expr)
-            elif isinstance(expr, rivendel.ScalarFunction):
-                if expr.name == "get_field":
-                    args = expr.args
-                    base = to_odata_filter(args[0])
-                    field = args[1].value
-                    # Remove quotes if present
-                    if (
-                        isinstance(field, str)
-                        and field.startswith("'")
-                        and field.endswith("'")
-                    ):
-                        field = field[1:-1]
-                    return f"{base}/{field}"
-                raise Exception(
-                    f"Scalar function: {expr.name} not supported in OData filter."
-                )
-            elif isinstance(expr, rivendel.ScalarVariable):
-                return str(expr)
-            elif isinstance(expr, str):
-                return f"'{expr}'"
-            elif isinstance(expr, rivendel.IsNull):
-                return f"{to_odata_filter(expr.expr)} eq null"
-            elif isinstance(expr, rivendel.IsNotNull):
-                return f"{to_odata_filter(expr.expr)} ne null"
-            elif isinstance(expr, rivendel.InList):
-                # OData doesn't have IN operator, convert to OR chain
-                field = to_odata_filter(expr.expr)
-                values = [to_odata_filter(item) for item in expr.list]
-                or_conditions = [f"{field} eq {value}" for value in values]
-                condition = "(" + " or ".join(or_conditions) + ")"
-                return f"not ({condition})" if expr.negated else condition
-            elif isinstance(expr, rivendel.Literal):
-                if isinstance(expr.value, str):
-                    return f"'{expr.value}'"
-                elif isinstance(expr.value, bool):
-                    return "true" if expr.value else "false"
-                elif isinstance(expr.value, datetime):
-                    return f"{expr.value.isoformat()}Z"
-                else:
-                    return str(expr.value)
-            elif isinstance(expr, rivendel.BinaryExpr):
-                left = to_odata_filter(expr.left)
-                right = to_odata_filter(expr.right)
-
-                if expr.operator.lower() == "and":
-                    return f"({left}) and ({right})"
-                elif expr.operator == "=":
-                    return f"{left} eq {right}"
-                elif expr.operator == "!=":
-                    return f"{left} ne {right}"
-                elif expr.operator == ">":
-                    return f"{left} gt {right}"
-                elif expr.operator == ">=":
-                    return f"{left} ge {right}"
-                elif expr.operator == "<":
-                    return f"{left} lt {right}"
-                elif expr.operator == "<=":
-                    return f"{left} le {right}"
-                elif expr.operator.lower() == "like" or expr.operator.lower() == "~*":
-                    # Convert LIKE to OData contains/startswith/endswith
-                    if isinstance(expr.right, rivendel.Literal) and isinstance(
-                        expr.right.value, str
-                    ):
-                        pattern = expr.right.value
-                        print(f"DEBUG: LIKE pattern: '{pattern}'")
-
-                        # Handle single quotes in pattern
-                        if pattern.startswith("'") and pattern.endswith("'"):
-                            pattern = pattern[1:-1]
-                            print(f"DEBUG: Removed outer quotes: '{pattern}'")
-
-                        if pattern.startswith("%") and pattern.endswith("%"):
-                            # %text% -> contains
-                            search_term = pattern[1:-1]
-                            result = f"contains({left}, '{search_term}')"
-                        elif pattern.startswith("%"):
-                            # %text -> endswith
-                            search_term = pattern[1:]
-                            result = f"endsWith({left}, '{search_term}')"
-                        elif pattern.endswith("%"):
-                            # text% -> startswith
-                            search_term = pattern[:-1]
-                            result = f"startsWith({left}, '{search_term}')"
-                        else:
-                            # Exact match
-                            result = f"{left} eq '{pattern}'"
-
-                        print(f"DEBUG: LIKE converted to: {result}")
-                        return result
-                    else:
-                        return f"contains({left}, {right})"
-                elif expr.operator.lower() == "or":
-                    return f"({left}) or ({right})"
-                else:
-                    return f"({left}) {expr.operator} ({right})"
-            elif isinstance(expr, rivendel.IsFalse):
-                return f"{to_odata_filter(expr.expr)} eq false"
-            elif isinstance(expr, rivendel.IsTrue):
-                return f"{to_odata_filter(expr.expr)} eq true"
+            handler = find_expression_handler(
+                ODATA_HANDLERS, _ODATA_HANDLER_CACHE, type(expr)
+            )
+            if handler is not None:
+                return handler(expr)
 
             # If we get here, the expression type is not supported
-            print(f"DEBUG: Unsupported expression type: {type(expr)}")
-            print(f"DEBUG: Expression details: {expr}")
-            print(f"DEBUG: Expression attributes: {dir(expr)}")
+            logger.debug("Unsupported expression type: {}", type(expr))
+            logger.debug("Expression details: {}", expr)
+            logger.opt(lazy=True).debug("Expression attributes: {}", lambda: dir(expr))
 
             raise Exception(
                 f"Expression not supported in OData filter: {expr} ({type(expr)})"
             )
 
+        def odata_inner(expr):
+            """Convert Alias and Cast expressions through the wrapped expression"""
+            return to_odata_filter(expr.expr)
+
+        def odata_column(expr):
+            """Convert a column to its Graph API field"""
+            # Map column name to Graph API field
+            column_name = expr.name
+            return COLUMN_MAPPING.get(column_name, column_name)
+
+        def odata_indexed_field(expr):
+            """Convert nested field access to a Graph API path"""
+            # Handle nested field access recursively like from['emailAddress']['address']
+            logger.debug("IndexedField - expr: {}, key: {}", expr.expr, expr.key)
+
+            # Recursively process the base expression
+            base_field = to_odata_filter(expr.expr)
+            key = expr.key
+
+            # Handle Literal key (quoted strings)
+            if isinstance(key, rivendel.Literal):
+                key = key.value
+                logger.debug("Key was Literal, extracted value: {}", key)
+
+            # Remove quotes from key if present
+            if isinstance(key, str) and key.startswith("'") and key.endswith("'"):
+                key = key[1:-1]
+                logger.debug("Removed quotes from key: {}", key)
+
+            # Build path recursively - no hardcoded special cases needed
+            result = f"{base_field}/{key}"
+            logger.debug("IndexedField result: {}", result)
+            return result
+
+        def odata_scalar_function(expr):
+            """Convert get_field() calls to a Graph API path"""
+            if expr.name == "get_field":
+                args = expr.args
+                base = to_odata_filter(args[0])
+                field = args[1].value
+                # Remove quotes if present
+                if (
+                    isinstance(field, str)
+                    and field.startswith("'")
+                    and field.endswith("'")
+                ):
+                    field = field[1:-1]
+                return f"{base}/{field}"
+            raise Exception(
+                f"Scalar function: {expr.name} not supported in OData filter."
+            )
+
+        def odata_scalar_variable(expr):
+            """Convert a scalar variable"""
+            return str(expr)
+
+        def odata_string(expr):
+            """Convert a plain string to an OData string"""
+            return f"'{expr}'"
+
+        def odata_is_null(expr):
+            """Convert IS NULL expressions"""
+            return f"{to_odata_filter(expr.expr)} eq null"
+
+        def odata_is_not_null(expr):
+            """Convert IS NOT NULL expressions"""
+            return f"{to_odata_filter(expr.expr)} ne null"
+
+        def odata_in_list(expr):
+            """Convert IN list expressions"""
+            # OData doesn't have IN operator, convert to OR chain
+            field = to_odata_filter(expr.expr)
+            values = [to_odata_filter(item) for item in expr.list]
+            or_conditions = [f"{field} eq {value}" for value in values]
+            condition = "(" + " or ".join(or_conditions) + ")"
+            return f"not ({condition})" if expr.negated else condition
+
+        def odata_literal(expr):
+            """Convert a literal to an OData value"""
+            if isinstance(expr.value, str):
+                return f"'{expr.value}'"
+            elif isinstance(expr.value, bool):
+                return "true" if expr.value else "false"
+            elif isinstance(expr.value, datetime):
+                return f"{expr.value.isoformat()}Z"
+            else:
+                return str(expr.value)
+
+        def odata_binary(expr):
+            """Convert binary operator expressions"""
+            left = to_odata_filter(expr.left)
+            right = to_odata_filter(expr.right)
+
+            operator = expr.operator.lower()
+
+            if operator == "and":
+                return f"({left}) and ({right})"
+            elif expr.operator in ODATA_OPERATORS:
+                return f"{left} {ODATA_OPERATORS[expr.operator]} {right}"
+            elif operator == "like" or operator == "~*":
+                # Convert LIKE to OData contains/startswith/endswith
+                if isinstance(expr.right, rivendel.Literal) and isinstance(
+                    expr.right.value, str
+                ):
+                    pattern = expr.right.value
+                    logger.debug("LIKE pattern: '{}'", pattern)
+
+                    # Handle single quotes in pattern
+                    if pattern.startswith("'") and pattern.endswith("'"):
+                        pattern = pattern[1:-1]
+                        logger.debug("Removed outer quotes: '{}'", pattern)
+
+                    if pattern.startswith("%") and pattern.endswith("%"):
+                        # %text% -> contains
+                        search_term = pattern[1:-1]
+                        result = f"contains({left}, '{search_term}')"
+                    elif pattern.startswith("%"):
+                        # %text -> endswith
+                        search_term = pattern[1:]
+                        result = f"endsWith({left}, '{search_term}')"
+                    elif pattern.endswith("%"):
+                        # text% -> startswith
+                        search_term = pattern[:-1]
+                        result = f"startsWith({left}, '{search_term}')"
+                    else:
+                        # Exact match
+                        result = f"{left} eq '{pattern}'"
+
+                    logger.debug("LIKE converted to: {}", result)
+                    return result
+                else:
+                    return f"contains({left}, {right})"
+            elif operator == "or":
+                return f"({left}) or ({right})"
+            else:
+                return f"({left}) {expr.operator} ({right})"
+
+        def odata_is_false(expr):
+            """Convert IS FALSE expressions"""
+            return f"{to_odata_filter(expr.expr)} eq false"
+
+        def odata_is_true(expr):
+            """Convert IS TRUE expressions"""
+            return f"{to_odata_filter(expr.expr)} eq true"
+
+        # Handlers in the order of precedence, the first matching class is used
+        ODATA_HANDLERS = [
+            (rivendel.Alias, odata_inner),
+            (rivendel.Column, odata_column),
+            (rivendel.IndexedField, odata_indexed_field),
+            (rivendel.Cast, odata_inner),
+            (rivendel.ScalarFunction, odata_scalar_function),
+            (rivendel.ScalarVariable, odata_scalar_variable),
+            (str, odata_string),
+            (rivendel.IsNull, odata_is_null),
+            (rivendel.IsNotNull, odata_is_not_null),
+            (rivendel.InList, odata_in_list),
+            (rivendel.Literal, odata_literal),
+            (rivendel.BinaryExpr, odata_binary),
+            (rivendel.IsFalse, odata_is_false),
+            (rivendel.IsTrue, odata_is_true),
+        ]
+
         def handle_like_expression(like_expr):
             """Handle datafusion Like expressions"""
-            print(f"DEBUG: Handling LIKE expression: {like_expr}")
+            logger.debug("Handling LIKE expression: {}", like_expr)
 
             # Extract left side (field) and right side (pattern)
             field_expr = like_expr.expr
             pattern = extract_datafusion_value(like_expr.pattern)
 
-            print(f"DEBUG: LIKE field: {field_expr}, pattern: '{pattern}'")
+            logger.debug("LIKE field: {}, pattern: '{}'", field_expr, pattern)
 
             # Convert field to OData path and validate for Graph API
             field_path = to_odata_filter(field_expr)
             field_path = validate_graph_field_path(field_path)
-            print(f"DEBUG: Field path (validated): {field_path}")
+            logger.debug("Field path (validated): {}", field_path)
 
             # Graph API has very limited OData function support
             # Skip complex filters and use only basic supported operations
@@ -686,8 +1169,12 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                         result = f"{array_name}/any(r: contains(r/{element_path}, '{search_term}'))"
                     else:
                         result = f"{array_name}/any(r: r/{element_path} eq '{pattern}')"
-                    print(
-                        f"DEBUG: Array field '{field_path}' with pattern '{pattern}' using element path '{element_path}' -> {result}"
+                    logger.debug(
+                        "Array field '{}' with pattern '{}' using element path '{}' -> {}",
+                        field_path,
+                        pattern,
+                        element_path,
+                        result,
                     )
             # Convert LIKE pattern to Graph API compatible syntax for regular fields
             else:
@@ -710,64 +1197,38 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                         # %text or text% -> use contains (endsWith/startsWith not supported for messages)
                         search_term = pattern.strip("%")
                         result = f"contains({field_path}, '{search_term}')"
-                        print(
-                            f"DEBUG: Converting LIKE pattern '{pattern}' to contains() since endsWith/startsWith not supported"
+                        logger.debug(
+                            "Converting LIKE pattern '{}' to contains() since endsWith/startsWith not supported",
+                            pattern,
                         )
                     else:
                         # Exact match
                         result = f"{field_path} eq '{pattern}'"
 
                     # Debug output to see what we're generating
-                    print(f"DEBUG: Pattern '{pattern}' -> OData: {result}")
+                    logger.debug("Pattern '{}' -> OData: {}", pattern, result)
                 else:
                     # Unsupported field path
-                    print(f"DEBUG: Unsupported field path: {field_path}")
+                    logger.debug("Unsupported field path: {}", field_path)
                     return None
 
-            print(f"DEBUG: LIKE converted to: {result}")
+            logger.debug("LIKE converted to: {}", result)
             return result
 
+        # Comparisons that $search can not express
+        SEARCH_SKIPPED_OPERATORS = frozenset([">", ">=", "<", "<=", "!=", "ne"])
+
         def to_search_query(expr):
             """Convert rivendel expression to Graph API $search syntax"""
-            print(f"DEBUG: Processing search expression: {expr} (type: {type(expr)})")
-
-            # Handle DataFusion expressions using isinstance
-            if isinstance(expr, rivendel.BinaryExpr):
-                # Check for comparison operators first, before processing operands
-                if expr.operator in [">", ">=", "<", "<=", "!=", "ne"]:
-                    print(
-                        f"DEBUG: Skipping comparison operator {expr.operator} in search mode"
-                    )
-                    return None
-
-                # Process operands only after checking operator
-                left = to_search_query(expr.left)
-                right = to_search_query(expr.right)
-
-                if expr.operator.lower() == "and":
-                    return f"({left}) AND ({right})"
-                elif expr.operator.lower() == "or":
-                    return f"({left}) OR ({right})"
-                elif (
-                    expr.operator == "="
-                    or expr.operator.lower() == "like"
-                    or expr.operator.lower() == "~*"
-                ):
-                    return f"{left}:{right}"
-                return None
-            elif isinstance(expr, rivendel.Like):
-                return handle_like_search_expression(expr)
-            elif isinstance(expr, rivendel.Column):
-                column_name = expr.name
-                # Map to search field
-                search_mappings = table_config.get("search_field_mappings", {})
-                return search_mappings.get(column_name, column_name)
+            logger.debug(
+                "Processing search expression: {} (type: {})", expr, type(expr)
+            )
 
-            elif isinstance(expr, rivendel.Literal):
-                if isinstance(expr.value, str):
-                    return expr.value.strip("%\"'")
-                else:
-                    return str(expr.value)
+            handler = find_expression_handler(
+                SEARCH_HANDLERS, _SEARCH_HANDLER_CACHE, type(expr)
+            )
+            if handler is not None:
+                return handler(expr)
 
             # Handle DataFusion literal values
             if isinstance(expr, (rivendel.Literal, rivendel.ScalarValue)):
@@ -785,7 +1246,7 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                         dt = datetime.fromtimestamp(microseconds / 1000000)
                         return dt.strftime("%Y-%m-%d")
                 except Exception as e:
-                    print(f"DEBUG: Could not convert timestamp {expr}: {e}")
+                    logger.debug("Could not convert timestamp {}: {}", expr, e)
                     return None
 
             # Handle other DataFusion literal values
@@ -796,89 +1257,136 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                 else:
                     return str(value)
 
-            print(f"DEBUG: Unsupported search expression: {expr}")
+            logger.debug("Unsupported search expression: {}", expr)
+            return None
+
+        def search_binary(expr):
+            """Convert binary operator expressions to search terms"""
+            # Check for comparison operators first, before processing operands
+            if expr.operator in SEARCH_SKIPPED_OPERATORS:
+                logger.debug(
+                    "Skipping comparison operator {} in search mode", expr.operator
+                )
+                return None
+
+            # Process operands only after checking operator
+            left = to_search_query(expr.left)
+            right = to_search_query(expr.right)
+
+            operator = expr.operator.lower()
+
+            if operator == "and":
+                return f"({left}) AND ({right})"
+            elif operator == "or":
+                return f"({left}) OR ({right})"
+            elif expr.operator == "=" or operator == "like" or operator == "~*":
+                return f"{left}:{right}"
             return None
 
+        def search_column(expr):
+            """Convert a column to its search field"""
+            column_name = expr.name
+            # Map to search field
+            search_mappings = table_config.get("search_field_mappings", {})
+            return search_mappings.get(column_name, column_name)
+
+        def search_literal(expr):
+            """Convert a literal to a search value"""
+            if isinstance(expr.value, str):
+                return expr.value.strip("%\"'")
+            else:
+                return str(expr.value)
+
         def handle_like_search_expression(like_expr):
             """Handle datafusion Like expressions for search"""
-            print(f"DEBUG: Handling LIKE search expression: {like_expr}")
+            logger.debug("Handling LIKE search expression: {}", like_expr)
 
             field_expr = like_expr.expr
             pattern = extract_datafusion_value(like_expr.pattern)
-            print(f"DEBUG: Field expression: {field_expr}, type: {type(field_expr)}")
-            print(f"DEBUG: Pattern value: {pattern}")
+            logger.debug("Field expression: {}, type: {}", field_expr, type(field_expr))
+            logger.debug("Pattern value: {}", pattern)
 
             # Clean up pattern for search
             search_term = pattern.strip("%\"'")
 
             # Escape special characters for Graph API search
             search_term = escape_search_term(search_term)
-            print(f"DEBUG: Cleaned and escaped search term: {search_term}")
+            logger.debug("Cleaned and escaped search term: {}", search_term)
 
             # Convert field to search field
             if isinstance(field_expr, rivendel.Column):
                 field_name = field_expr.name
                 search_mappings = table_config.get("search_field_mappings", {})
                 search_field = search_mappings.get(field_name, field_name)
-                print(
-                    f"DEBUG: Column field '{field_name}' mapped to search field '{search_field}'"
+                logger.debug(
+                    "Column field '{}' mapped to search field '{}'",
+                    field_name,
+                    search_field,
                 )
                 if search_term is None:
-                    print(f"DEBUG: Skipping search term due to special characters")
+                    logger.debug("Skipping search term due to special characters")
                     return None
                 return f"{search_field}:{search_term}"
             elif isinstance(field_expr, rivendel.ScalarFunction):
                 # Handle nested field access for search
-                print(f"DEBUG: Processing ScalarFunction for search")
+                logger.debug("Processing ScalarFunction for search")
                 if search_term is None:
-                    print(f"DEBUG: Skipping nested search due to special characters")
+                    logger.debug("Skipping nested search due to special characters")
                     return None
                 return handle_nested_search_field(field_expr, search_term)
 
-            print(f"DEBUG: Using default subject fallback")
+            logger.debug("Using default subject fallback")
             if search_term is None:
-                print(f"DEBUG: Skipping default fallback due to special characters")
+                logger.debug("Skipping default fallback due to special characters")
                 return None
             return f"subject:{search_term}"  # Default fallback
 
+        # Handlers in the order of precedence, the first matching class is used
+        SEARCH_HANDLERS = [
+            (rivendel.BinaryExpr, search_binary),
+            (rivendel.Like, handle_like_search_expression),
+            (rivendel.Column, search_column),
+            (rivendel.Literal, search_literal),
+        ]
+
         def handle_nested_search_field(func_expr, search_term):
             """Handle nested field access in search like from.emailAddress.address"""
-            print(f"DEBUG: Handling nested search field: {func_expr}")
+            logger.debug("Handling nested search field: {}", func_expr)
 
             # Extract the base field from nested get_field calls
             base_field = extract_base_field_from_nested(func_expr)
-            print(f"DEBUG: Extracted base field: {base_field}")
+            logger.debug("Extracted base field: {}", base_field)
 
             # Map to search field
             search_mappings = table_config.get("search_field_mappings", {})
             search_field = search_mappings.get(base_field, base_field)
 
-            print(f"DEBUG: Mapped '{base_field}' to search field '{search_field}'")
+            logger.debug("Mapped '{}' to search field '{}'", base_field, search_field)
             if search_term is None:
-                print(f"DEBUG: Skipping nested search due to special characters")
+                logger.debug("Skipping nested search due to special characters")
                 return None
             return f"{search_field}:{search_term}"
 
         def extract_base_field_from_nested(expr):
             """Recursively extract the base field from nested get_field expressions"""
-            print(
-                f"DEBUG: extract_base_field_from_nested input: {expr}, type: {type(expr)}"
+            logger.debug(
+                "extract_base_field_from_nested input: {}, type: {}", expr, type(expr)
             )
 
             if isinstance(expr, rivendel.ScalarFunction) and expr.name == "get_field":
                 # This is a get_field function, get the base expression (first argument)
                 if hasattr(expr, "args") and len(expr.args) > 0:
                     base_expr = expr.args[0]
-                    print(f"DEBUG: get_field base expression: {base_expr}")
+                    logger.debug("get_field base expression: {}", base_expr)
                     return extract_base_field_from_nested(base_expr)
             elif isinstance(expr, rivendel.Column):
                 field_name = expr.name
-                print(f"DEBUG: Found base Column field: {field_name}")
+                logger.debug("Found base Column field: {}", field_name)
                 return field_name
 
             # Fallback - try to extract from string representation
             expr_str = str(expr)
-            print(f"DEBUG: Using fallback string extraction from: {expr_str}")
+            logger.debug("Using fallback string extraction from: {}", expr_str)
             if "from" in expr_str.lower():
                 return "from"
             elif "recipient" in expr_str.lower():
@@ -913,8 +1421,8 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
             # For conversationId and other special fields, be more aggressive
             if len(term) > 50 or any(c in term for c in "=+/\\"):
                 # This looks like an ID field with special chars - skip search for these
-                print(
-                    f"DEBUG: Skipping search for term with special characters: {term}"
+                logger.debug(
+                    "Skipping search for term with special characters: {}", term
                 )
                 return None
 
@@ -927,17 +1435,17 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
 
         def handle_get_field_function(func_expr):
             """Handle datafusion get_field scalar functions"""
-            print(f"DEBUG: Handling get_field: {func_expr}")
+            logger.debug("Handling get_field: {}", func_expr)
 
             if not hasattr(func_expr, "args") or len(func_expr.args) < 2:
-                print(f"DEBUG: get_field function has invalid args: {func_expr}")
+                logger.debug("get_field function has invalid args: {}", func_expr)
                 raise Exception(f"get_field function missing required arguments")
 
             args = func_expr.args
             base_expr = args[0]
             field_name = extract_datafusion_value(args[1])
 
-            print(f"DEBUG: get_field base: {base_expr}, field: {field_name}")
+            logger.debug("get_field base: {}, field: {}", base_expr, field_name)
 
             # Recursively process the base expression
             base_path = to_odata_filter(base_expr)
@@ -945,15 +1453,15 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
             # Build the full path and validate it
             result = f"{base_path}/{field_name}"
             result = validate_graph_field_path(result)
-            print(f"DEBUG: get_field result: {result}")
+            logger.debug("get_field result: {}", result)
             return result
 
         def handle_array_element_function(func_expr):
             """Handle datafusion array_element scalar functions for array indexing like toRecipients[0]"""
-            print(f"DEBUG: Handling array_element: {func_expr}")
+            logger.debug("Handling array_element: {}", func_expr)
 
             if not hasattr(func_expr, "args") or len(func_expr.args) < 2:
-                print(f"DEBUG: array_element function has invalid args: {func_expr}")
+                logger.debug("array_element function has invalid args: {}", func_expr)
                 raise Exception(f"array_element function missing required arguments")
 
             args = func_expr.args
@@ -966,7 +1474,7 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
             # Extract the index value
             index_value = extract_datafusion_value(index_expr)
 
-            print(f"DEBUG: array_element array: {array_field}, index: {index_value}")
+            logger.debug("array_element array: {}, index: {}", array_field, index_value)
 
             # Build the array access path
             # Graph API uses /any() operator for array filtering instead of direct indexing
@@ -979,7 +1487,7 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                 # For other arrays, try direct indexing (may not work in Graph API)
                 result = f"{array_field}/{index_value}"
 
-            print(f"DEBUG: array_element result: {result}")
+            logger.debug("array_element result: {}", result)
             return result
 
         # Choose between filter and search based on configuration
@@ -990,26 +1498,25 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
             # Add expressions from exprs parameter (these are typically search strings)
             for expr_str in exprs:
                 if expr_str and expr_str.strip():
-                    print(f"Adding search expression: {expr_str}")
+                    logger.debug("Adding search expression: {}", expr_str)
                     search_exprs.append(expr_str)
 
             # Process rivendel expressions for search
             for f in filters:
                 try:
-                    print(f"DEBUG: Processing search filter: {f}")
+                    logger.debug("Processing search filter: {}", f)
                     search_query = to_search_query(f)
-                    print(f"DEBUG: Converted to search: {search_query}")
+                    logger.debug("Converted to search: {}", search_query)
                     if search_query and search_query.strip() and search_query != "None":
                         search_exprs.append(search_query)
                     else:
-                        print(
-                            f"DEBUG: Skipping empty or None search query: {search_query}"
+                        logger.debug(
+                            "Skipping empty or None search query: {}", search_query
                         )
                 except Exception as exc:
-                    print(f"Exception processing search filter {f}: {exc}")
-                    import traceback
-
-                    traceback.print_exc()
+                    logger.opt(exception=exc).debug(
+                        "Exception processing search filter {}: {}", f, exc
+                    )
                     # will be filtered by data engine
                     pass
 
@@ -1026,9 +1533,9 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                         f"({expr})" for expr in valid_search_exprs
                     )
                     params["$search"] = f'"{combined_search}"'
-                    print(f"Using Graph API search: {combined_search}")
+                    logger.debug("Using Graph API search: {}", combined_search)
                 else:
-                    print("DEBUG: No valid search expressions after filtering")
+                    logger.debug("No valid search expressions after filtering")
 
         elif use_filter:
             # Build filter expressions (existing logic)
@@ -1045,16 +1552,15 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
             # Process rivendel filter expressions
             for f in filters:
                 try:
-                    print(f"DEBUG: Processing filter: {f}")
+                    logger.debug("Processing filter: {}", f)
                     odata_filter = to_odata_filter(f)
-                    print(f"DEBUG: Converted to OData: {odata_filter}")
+                    logger.debug("Converted to OData: {}", odata_filter)
                     if odata_filter and odata_filter.strip():
                         filter_exprs.append(odata_filter)
                 except Exception as exc:
-                    print(f"Exception processing filter {f}: {exc}")
-                    import traceback
-
-                    traceback.print_exc()
+                    logger.opt(exception=exc).debug(
+                        "Exception processing filter {}: {}", f, exc
+                    )
                     # will be filtered by data engine
                     pass
 
@@ -1062,7 +1568,7 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
             if filter_exprs:
                 combined_filter = " and ".join(f"({expr})" for expr in filter_exprs)
                 params["$filter"] = combined_filter
-                print(f"Using OData filter: {combined_filter}")
+                logger.debug("Using OData filter: {}", combined_filter)
 
                 # Debug field path usage
                 supported_nested_fields = table_config.get(
@@ -1070,22 +1576,22 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
                 )
                 for nested_field in supported_nested_fields:
                     if nested_field in combined_filter:
-                        print(f"DEBUG: Using configured nested field: {nested_field}")
+                        logger.debug("Using configured nested field: {}", nested_field)
         else:
-            print("DEBUG: Both filtering and search are disabled")
+            logger.debug("Both filtering and search are disabled")
 
-        print(f"Built URL: {url} with params: {params}")
+        logger.debug("Built URL: {} with params: {}", url, params)
 
         # Debug: Show how filters were processed
         if filters:
-            print("Original filters:")
+            logger.debug("Original filters:")
             for i, f in enumerate(filters):
-                print(f"  Filter {i}: {f} (type: {type(f)})")
+                logger.debug("  Filter {}: {} (type: {})", i, f, type(f))
                 # Debug nested field access
                 if hasattr(f, "left") and hasattr(f, "right"):
-                    print(f"    Left: {f.left} (type: {type(f.left)})")
-                    print(f"    Right: {f.right} (type: {type(f.right)})")
-                    print(f"    Operator: {f.operator}")
+                    logger.debug("    Left: {} (type: {})", f.left, type(f.left))
+                    logger.debug("    Right: {} (type: {})", f.right, type(f.right))
+                    logger.debug("    Operator: {}", f.operator)
 
         return (url, params)
 
@@ -1130,60 +1636,100 @@ class AzureGraphTableProvider(BaseAzureTableProvider):
     async def execute(self, filters, *args, **kwargs):
         limit = kwargs.get("limit", 1000)
 
-        print(f"Execute called with {len(filters)} filters")
+        logger.debug("Execute called with {} filters", len(filters))
         for i, f in enumerate(filters):
-            print(f"Filter {i}: {f} (type: {type(f)})")
+            logger.debug("Filter {}: {} (type: {})", i, f, type(f))
 
-        async def execute_mailbox(mailbox, limit):
-            # Check if we should use search mode
-            table_config = self._config
-            use_search_param = table_config.get("use_search", False)
+        # Check if we should use search mode
+        table_config = self._config
+        use_search_param = table_config.get("use_search", False)
 
-            (url, params) = self._build_url(
+        mailboxes = self._config.get("mailboxes")
+        requests = [
+            self._build_url(
                 mailbox,
                 filters,
                 self._config.get("search"),
                 top=200,
                 use_search=use_search_param,
             )
+            for mailbox in mailboxes
+        ]
+
+        # Fetch the first page of the mailboxes with $batch, which combines
+        # up to BATCH_SIZE mailboxes in a single round trip. A group is only
+        # fetched once one of its mailboxes is enumerated, so it counts
+        # against the concurrency bound and is skipped once limit is reached.
+        use_batch = table_config.get("use_batch", True) and len(mailboxes) > 1
+        batches = {}
+
+        async def first_page(index):
+            group = index // BATCH_SIZE
+            if group not in batches:
+                start = group * BATCH_SIZE
+                batches[group] = asyncio.create_task(
+                    self.client.batch(requests[start : start + BATCH_SIZE])
+                )
+
+            # The other mailboxes of the group still need the batch when this
+            # one is cancelled
+            pages = await asyncio.shield(batches[group])
 
-            print(f"Executing mailbox: {mailbox} => {url} with params: {params}")
+            # Hand the page over, so it is freed once the mailbox consumed it
+            page, pages[index % BATCH_SIZE] = pages[index % BATCH_SIZE], None
+            return page
+
+        async def execute_mailbox(mailbox, index, url, params, limit):
+            logger.debug(
+                "Executing mailbox: {} => {} with params: {}", mailbox, url, params
+            )
 
             count = 0
 
-            async for item in self.client.get(url, params):
-                item = process_item_recursively(item)
+            # Bound the number of mailboxes enumerated at the same time
+            async with self._sem:
+                if use_batch:
+                    items = self.client.get_from(await first_page(index))
+                else:
+                    items = self.client.get(url, params)
+
+                async for item in items:
+                    item = process_item_recursively(item)
 
-                # Process the item (default implementation just yields the item)
-                for item in self.process_item(mailbox, item):
-                    yield item
+                    # Process the item (default implementation just yields the item)
+                    for item in self.process_item(mailbox, item):
+                        yield item
 
-                count += 1
-                if limit and count > limit:
-                    break
+                    count += 1
+                    if limit and count > limit:
+                        break
 
         tasks = []
 
-        for mailbox in self._config.get("mailboxes"):
-            tasks.append(execute_mailbox(mailbox, limit))
+        for index, (mailbox, (url, params)) in enumerate(zip(mailboxes, requests)):
+            tasks.append(execute_mailbox(mailbox, index, url, params, limit))
 
         merged = aiostream.stream.merge(*tasks)
 
         count = 0
 
-        # Process data in chunks to avoid memory issues
-        async with merged.stream() as streamer:
-            async for chunk in chunks(streamer, self._chunk_size):
-                if not chunk:  # Skip empty chunks
-                    continue
+        try:
+            # Process data in chunks to avoid memory issues
+            async with merged.stream() as streamer:
+                async for chunk in chunks(streamer, self._chunk_size):
+                    if not chunk:  # Skip empty chunks
+                        continue
 
-                rb = pa.RecordBatch.from_pylist(chunk, schema=self._schema)
-                yield rb
+                    rb = pa.RecordBatch.from_pylist(chunk, schema=self._schema)
+                    yield rb
 
-                count += len(chunk)
+                    count += len(chunk)
 
-                if limit and count > limit:
-                    return
+                    if limit and count > limit:
+                        return
+        finally:
+            for batch in batches.values():
+                batch.cancel()
 
     def _process_item_with_type_conversion(self, item):
         """Process an item with type conversion based on configuration.